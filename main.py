@@ -7,79 +7,203 @@ Version: 1.0.0
 """
 import os
 import sys
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
 from pathlib import Path
 
-# Add src directory to path
 current_dir = Path(__file__).parent
-src_dir = current_dir / 'src'
-sys.path.insert(0, str(src_dir))
+
+def _report_missing_packages(error):
+    """Print install instructions for a failed import"""
+    print(f"❌ Missing required packages: {error}")
+    print("Please install required packages:")
+    print("pip install -r requirements.txt")
 
 try:
-    import pandas as pd
     from dotenv import load_dotenv
     
-    from utils import (
+    from src.utils import (
         load_oxford_data, clear_screen, print_header, 
         print_success, print_error, print_warning, print_info, Colors
     )
-    from translator import LLMTranslator
-    from word_picker import WordPicker
-    from game import OxfordVocabGame
     
 except ImportError as e:
-    print(f"❌ Missing required packages: {e}")
-    print("Please install required packages:")
-    print("pip install -r requirements.txt")
+    _report_missing_packages(e)
     sys.exit(1)
 
+@lru_cache(maxsize=1)
+def _ensure_env_loaded():
+    """Load the .env file once per process"""
+    load_dotenv()
+    return True
+
+@dataclass
+class Env:
+    """Lazily read environment settings"""
+
+    @cached_property
+    def groq_api_key(self):
+        _ensure_env_loaded()
+        return os.getenv('GROQ_API_KEY')
+
+_env = Env()
+
 def check_environment():
     """Check if environment is properly configured"""
     issues = []
     
+    # List each directory once instead of probing every path separately
+    top_entries = {entry.name for entry in os.scandir(current_dir)}
+    data_dir = current_dir / 'data'
+    try:
+        data_entries = {entry.name for entry in os.scandir(data_dir)} if 'data' in top_entries else set()
+    except (FileNotFoundError, NotADirectoryError):
+        data_entries = set()
+    
     # Check for .env file
-    env_file = current_dir / '.env'
-    if not env_file.exists():
+    if '.env' not in top_entries:
         issues.append("⚠️  .env file not found. Please copy .env.example to .env and configure your Groq API key.")
     
     # Load environment variables
-    load_dotenv()
+    _ensure_env_loaded()
     
     # Check for Groq API key
-    groq_key = os.getenv('GROQ_API_KEY')
+    groq_key = _env.groq_api_key
     if not groq_key or groq_key == 'your_groq_api_key_here':
         issues.append("⚠️  GROQ_API_KEY not configured. Please set your Groq API key in .env file.")
     
     # Check data files
-    data_dir = current_dir / 'data'
     oxford_3000_file = data_dir / 'oxford_3000.csv'
     oxford_5000_file = data_dir / 'oxford_5000.csv'
     
-    if not oxford_3000_file.exists():
+    if oxford_3000_file.name not in data_entries:
         issues.append(f"❌ Oxford 3000 data file not found: {oxford_3000_file}")
     
-    if not oxford_5000_file.exists():
+    if oxford_5000_file.name not in data_entries:
         issues.append(f"⚠️  Oxford 5000 data file not found: {oxford_5000_file} (optional)")
     
     return issues
 
+def _load_vocabulary(oxford_file):
+    """Load vocabulary data, reusing a pickled copy of the parsed CSV when fresh"""
+    import pandas as pd
+    
+    cache_file = oxford_file.with_suffix('.pkl')
+    try:
+        if cache_file.stat().st_mtime >= oxford_file.stat().st_mtime:
+            df = pd.read_pickle(cache_file)
+            print_success(f"Loaded {len(df)} words from {cache_file.name}")
+            return df
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print_warning(f"Ignoring unreadable cache {cache_file.name}: {e}")
+    
+    df = load_oxford_data(str(oxford_file))
+    if not df.empty:
+        try:
+            df.to_pickle(cache_file)
+        except OSError as e:
+            print_warning(f"Could not write cache {cache_file.name}: {e}")
+    return df
+
+@lru_cache(maxsize=1)
+def _build_components():
+    """
+    Load vocabulary data and build the translator once per process
+    
+    Returns:
+        Tuple of (vocabulary_df, translator)
+    
+    Raises:
+        ImportError: If a required package is missing
+        RuntimeError: If the vocabulary or translator cannot be initialized
+    """
+    from src.translator import LLMTranslator
+    
+    # Load data
+    oxford_file = current_dir / 'data' / 'oxford_5000.csv'
+    print_info(f"📚 Loading vocabulary data from {oxford_file.name}...")
+    vocabulary_df = _load_vocabulary(oxford_file)
+    
+    if vocabulary_df.empty:
+        raise RuntimeError("Failed to load vocabulary data. Please check the data file.")
+    
+    # Initialize translator
+    print_info("🤖 Initializing AI translator...")
+    try:
+        # .env was already loaded by check_environment(); reuse the cached key
+        translator = LLMTranslator(api_key=_env.groq_api_key)
+    except Exception as e:
+        raise RuntimeError(f"Failed to initialize translator: {e}") from e
+    print_success("AI translator ready!")
+    
+    return vocabulary_df, translator
+
+@lru_cache(maxsize=1)
+def _build_pipeline():
+    """
+    Build the vocabulary, translator and word picker once per process
+    
+    Returns:
+        Tuple of (vocabulary_df, translator, word_picker)
+    
+    Raises:
+        ImportError: If a required package is missing
+        RuntimeError: If the vocabulary or translator cannot be initialized
+    """
+    from src.word_picker import WordPicker
+    
+    vocabulary_df, translator = _build_components()
+    
+    # Initialize word picker (creates scores/ and the weights file)
+    scores_dir = current_dir / 'scores'
+    scores_dir.mkdir(exist_ok=True)
+    weights_file = scores_dir / 'word_weights.json'
+    
+    print_info("🎯 Initializing adaptive word picker...")
+    word_picker = WordPicker(vocabulary_df, str(weights_file))
+    print_success("Word picker ready!")
+    
+    return vocabulary_df, translator, word_picker
+
+# Static setup text, built once since Colors never changes
+_WELCOME_BANNER = f"""{Colors.INFO}Welcome to the AI-powered vocabulary learning game!{Colors.RESET}
+{Colors.INFO}This game uses LLaMA 4 via Groq API for intelligent translations.{Colors.RESET}
+
+{Colors.WARNING}📋 Setup Requirements:{Colors.RESET}
+1. 🔑 Groq API Key (free at https://console.groq.com/)
+2. 📊 Oxford 5000 data file (included)
+3. 🐍 Python packages (install with: pip install -r requirements.txt)
+
+{Colors.INFO}🚀 Getting Started:{Colors.RESET}
+1. Copy .env.example to .env
+2. Add your Groq API key to .env file
+3. Run this script again
+
+"""
+
+_SETUP_ISSUES_FOOTER = f"""
+{Colors.INFO}📖 Setup Instructions:{Colors.RESET}
+1. Get a free Groq API key:
+   • Visit: https://console.groq.com/
+   • Sign up/login
+   • Create an API key
+
+2. Configure your environment:
+   • Copy .env.example to .env
+   • Edit .env and add your API key:
+     GROQ_API_KEY=your_actual_api_key_here
+
+3. Install dependencies:
+   pip install -r requirements.txt
+"""
+
 def display_welcome():
     """Display welcome message and setup instructions"""
     clear_screen()
     print_header("🎓 Oxford Vocabulary Trainer Setup 🎓", 70)
-    
-    print(f"{Colors.INFO}Welcome to the AI-powered vocabulary learning game!{Colors.RESET}")
-    print(f"{Colors.INFO}This game uses LLaMA 4 via Groq API for intelligent translations.{Colors.RESET}\n")
-    
-    print(f"{Colors.WARNING}📋 Setup Requirements:{Colors.RESET}")
-    print("1. 🔑 Groq API Key (free at https://console.groq.com/)")
-    print("2. 📊 Oxford 5000 data file (included)")
-    print("3. 🐍 Python packages (install with: pip install -r requirements.txt)")
-    
-    print(f"\n{Colors.INFO}🚀 Getting Started:{Colors.RESET}")
-    print("1. Copy .env.example to .env")
-    print("2. Add your Groq API key to .env file")
-    print("3. Run this script again")
-    print()
+    sys.stdout.write(_WELCOME_BANNER)
 
 def main():
     """Main application entry point"""
@@ -92,58 +216,33 @@ def main():
         for issue in issues:
             print(f"   {issue}")
         
-        print(f"\n{Colors.INFO}📖 Setup Instructions:{Colors.RESET}")
-        print("1. Get a free Groq API key:")
-        print("   • Visit: https://console.groq.com/")
-        print("   • Sign up/login")
-        print("   • Create an API key")
-        print()
-        print("2. Configure your environment:")
-        print("   • Copy .env.example to .env")
-        print("   • Edit .env and add your API key:")
-        print("     GROQ_API_KEY=your_actual_api_key_here")
-        print()
-        print("3. Install dependencies:")
-        print("   pip install -r requirements.txt")
+        sys.stdout.write(_SETUP_ISSUES_FOOTER)
         
         return
     
+    # Heavy dependencies are only needed once the environment checks pass
+    try:
+        from src.game import OxfordVocabGame
+    except ImportError as e:
+        _report_missing_packages(e)
+        return
+    
     try:
         # Initialize components
         print_info("🔧 Initializing Oxford Vocabulary Trainer...")
-          # Load data
-        data_dir = current_dir / 'data'
-        oxford_file = data_dir / 'oxford_5000.csv'
-        
-        print_info(f"📚 Loading vocabulary data from {oxford_file.name}...")
-        vocabulary_df = load_oxford_data(str(oxford_file))
-        
-        if vocabulary_df.empty:
-            print_error("Failed to load vocabulary data. Please check the data file.")
-            return
-        
-        # Initialize translator
-        print_info("🤖 Initializing AI translator...")
         try:
-            translator = LLMTranslator()
-            print_success("AI translator ready!")
-        except Exception as e:
-            print_error(f"Failed to initialize translator: {e}")
-            print_warning("Please check your Groq API key configuration.")
+            vocabulary_df, translator, word_picker = _build_pipeline()
+        except ImportError as e:
+            _report_missing_packages(e)
+            return
+        except RuntimeError as e:
+            print_error(str(e))
+            print_warning("Please check your data files and Groq API key configuration.")
             return
-        
-        # Initialize word picker
-        scores_dir = current_dir / 'scores'
-        scores_dir.mkdir(exist_ok=True)
-        weights_file = scores_dir / 'word_weights.json'
-        
-        print_info("🎯 Initializing adaptive word picker...")
-        word_picker = WordPicker(vocabulary_df, str(weights_file))
-        print_success("Word picker ready!")
         
         # Initialize game
         print_info("🎮 Initializing game engine...")
-        game = OxfordVocabGame(word_picker, translator, str(scores_dir))
+        game = OxfordVocabGame(word_picker, translator, str(current_dir / 'scores'))
         print_success("Game engine ready!")
         
         print_success("✅ All systems initialized successfully!")
@@ -172,25 +271,29 @@ def quick_test():
         for issue in issues:
             print(f"  {issue}")
         return
-      # Test data loading
-    data_dir = current_dir / 'data'
-    oxford_file = data_dir / 'oxford_5000.csv'
-    df = load_oxford_data(str(oxford_file))
     
-    if not df.empty:
-        print_success(f"✅ Data loaded successfully: {len(df)} words")
-        
-        # Show sample words
-        sample_words = df.head(3)
-        print_info("Sample words:")
-        for _, row in sample_words.iterrows():
-            print(f"  {row['word']} ({row['class']}, {row['level']})")
+    # Test data loading and translator initialization; the word picker is skipped
+    # so a test run doesn't write scores/word_weights.json
+    try:
+        df, translator = _build_components()
+    except ImportError as e:
+        _report_missing_packages(e)
+        return
+    except RuntimeError as e:
+        print_error(f"❌ Initialization failed: {e}")
+        return
+    
+    print_success(f"✅ Data loaded successfully: {len(df)} words")
+    
+    # Show sample words
+    sample_words = df.head(3)
+    print_info("Sample words:")
+    for word, word_class, level in sample_words[['word', 'class', 'level']].itertuples(index=False, name=None):
+        print(f"  {word} ({word_class}, {level})")
+    
+    print_success("✅ Translator initialized successfully")
     
-    # Test translator initialization
     try:
-        translator = LLMTranslator()
-        print_success("✅ Translator initialized successfully")
-        
         # Test single translation
         test_word = "hello"
         test_class = "exclamation"
@@ -4,16 +4,151 @@ Game logic and scoring system for Oxford Vocabulary Trainer
 import os
 import time
 import random
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
+from itertools import islice
 from typing import Dict, List, Optional, Tuple
-from utils import (
-    load_json_file, save_json_file, clear_screen, print_header, 
-    print_success, print_error, print_warning, print_info,
+from .utils import (
+    load_json_file, save_json_file, load_jsonl_file, append_jsonl_file, save_jsonl_file, clear_screen, print_header, 
+    print_success, print_error, print_warning, print_info, print_block,
     format_word_display, display_game_stats, validate_user_input,
+    MeaningIndex, precompute_meaning_index,
     get_level_description, Colors
 )
-from translator import LLMTranslator
-from word_picker import WordPicker
+from .translator import LLMTranslator
+from .word_picker import WordPicker
+
+# CEFR levels; Oxford 5000 has no C2 words, so adventure mode stops at C1
+LEVELS = ('a1', 'a2', 'b1', 'b2', 'c1', 'c2')
+ADVENTURE_LEVELS = ('a1', 'a2', 'b1', 'b2', 'c1')
+LEVEL_SHORT_DESC = {level: get_level_description(level).split(' - ')[0] for level in LEVELS}
+
+_MAIN_MENU_OPTIONS = f"""
+{Colors.WARNING}Choose your game mode:{Colors.RESET}
+1. 🎯 Custom Mode (Choose specific level)
+2. 🎲 Adventure Mode (Random levels A1-C1)
+3. 📈 View Statistics
+4. ⚙️  Settings
+5. ❌ Exit"""
+
+# Prompts and messages shown on every menu redraw or game turn
+_MAIN_MENU_INTRO = (f"{Colors.INFO}Welcome to the AI-powered vocabulary learning game!{Colors.RESET}\n"
+                    f"{Colors.INFO}Master Oxford 3000 words with intelligent AI translations.{Colors.RESET}\n")
+_MAIN_MENU_PROMPT = f"\n{Colors.BOLD}Enter your choice (1-5): {Colors.RESET}"
+_SETTINGS_MENU_PROMPT = f"\n{Colors.BOLD}Choose option (1-7): {Colors.RESET}"
+_QUESTION_TEXT = (f"\n{Colors.BOLD}What is the meaning of this word in Indonesian?{Colors.RESET}\n"
+                  f"{Colors.INFO}(Type 'hint' for a clue, 'skip' to skip, 'quit' to end game){Colors.RESET}")
+_ANSWER_PROMPT = f"\n{Colors.BOLD}Your answer: {Colors.RESET}"
+_CONTINUE_PROMPT = f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}"
+_CORRECT_CONTINUE_PROMPT = f"\n{Colors.SUCCESS}Press Enter to continue...{Colors.RESET}"
+_RETURN_TO_MENU_PROMPT = f"\n{Colors.INFO}Press Enter to return to main menu...{Colors.RESET}"
+
+# Static settings screens, each printed with a single write
+_ABOUT_LINES = [
+    f"{Colors.INFO}🎓 Oxford Vocabulary Trainer{Colors.RESET}",
+    "   AI-powered vocabulary learning game",
+    "   Version: 1.2.0",
+    "   Author: Rafi Project",
+    "",
+    f"{Colors.INFO}🤖 AI Features:{Colors.RESET}",
+    "   • LLaMA 3.1 8B Instant via Groq API for contextual translations",
+    "   • Advanced caching with persistent storage",
+    "   • Adaptive learning with weighted word selection",
+    "   • Smart answer validation (complete word matching)",
+    "",
+    f"{Colors.INFO}📚 Data Source:{Colors.RESET}",
+    "   • Oxford 3000 & 5000 most important English words",
+    "   • CEFR levels (A1, A2, B1, B2, C1, C2)",
+    "   • Part of speech classification",
+    "",
+    f"{Colors.INFO}🎮 Game Modes:{Colors.RESET}",
+    "   • Custom Mode: Choose specific CEFR level",
+    "   • Adventure Mode: Random levels A1-C1",
+    "",
+    f"{Colors.INFO}📊 Enhanced Statistics:{Colors.RESET}",
+    "   • Recently appeared words tracking (last 10)",
+    "   • Recently missed words tracking (last 10)",
+    "   • Complete session summaries (no truncation)",
+    "   • Detailed wrong answer breakdowns",
+    "",
+    f"{Colors.INFO}🧠 Learning Algorithm:{Colors.RESET}",
+    "   • Words you get wrong appear more frequently",
+    "   • Mastered words appear less often",
+    "   • Spaced repetition for optimal learning",
+    "   • Persistent word history tracking",
+    "",
+    f"{Colors.INFO}⚙️ Advanced Settings:{Colors.RESET}",
+    "   • Factory reset (complete data wipe)",
+    "   • Translation cache management",
+    "   • Statistics export and reset options",
+]
+
+_WIPE_WARNING_LINES = [
+    f"{Colors.WARNING}⚠ ⚠️  DANGER: This will PERMANENTLY DELETE ALL DATA!{Colors.RESET}",
+    f"{Colors.WARNING}⚠ This includes:{Colors.RESET}",
+    "   • All high scores and statistics",
+    "   • All learning progress and word weights",
+    "   • All translation cache",
+    "   • All session history",
+    "   • Recently appeared and missed words",
+    "",
+    f"{Colors.WARNING}⚠ The application will reset to its initial state.{Colors.RESET}",
+    f"{Colors.WARNING}⚠ This action CANNOT be undone!{Colors.RESET}",
+    f"\n{Colors.BOLD}Are you absolutely sure you want to continue?{Colors.RESET}",
+]
+
+_SETTINGS_MENU_OPTIONS = """1. 🔄 Reset All Statistics
+2. 🧹 Clear Translation Cache
+3. 📊 Export Statistics
+4. 🎯 Reset Specific Level
+5. 🗑️  Wipe All Data (Factory Reset)
+6. ℹ️  About
+7. ↩️  Back to Main Menu"""
+
+# Commands accepted instead of an answer
+GAME_COMMANDS = frozenset({'quit', 'skip', 'hint'})
+
+# Number of adventure levels drawn per random.choices call
+LEVEL_BATCH_SIZE = 128
+
+# Maximum answer indexes memoized per game instance (oldest evicted first)
+MEANING_INDEX_MEMO_LIMIT = 512
+
+# History sizes (newest entries first)
+RECENT_WORDS_LIMIT = 50
+WRONG_WORDS_LIMIT = 100
+
+# Number of finished sessions kept in memory for statistics (oldest first)
+SESSION_HISTORY_LIMIT = 20
+
+# Size at which sessions.jsonl is rewritten with only the last SESSION_HISTORY_LIMIT sessions
+SESSION_LOG_COMPACT_BYTES = 64 * 1024
+
+def _new_top_scores() -> Dict:
+    """Create empty top score records"""
+    return {
+        'overall': 0,
+        'by_level': dict.fromkeys(LEVELS, 0),
+        'by_mode': {
+            'custom': 0,
+            'adventure': 0
+        }
+    }
+
+def _new_session_stats(mode: Optional[str], level: Optional[str]) -> Dict:
+    """Create fresh statistics for a game session"""
+    return {
+        'start_time': datetime.now().isoformat(),
+        'words_attempted': 0,
+        'words_correct': 0,
+        'current_streak': 0,
+        'best_streak': 0,
+        'level_stats': {},
+        'wrong_answers': [],  # Store wrong answer details
+        'mode': mode,
+        'target_level': level
+    }
 
 class OxfordVocabGame:
     """Main game class for Oxford Vocabulary Trainer"""
@@ -32,85 +167,188 @@ class OxfordVocabGame:
         self.scores_dir = scores_dir
         self.scores_file = os.path.join(scores_dir, 'top_score.json')
         self.session_file = os.path.join(scores_dir, 'current_session.json')
+        self.sessions_file = os.path.join(scores_dir, 'sessions.jsonl')
         
         # Game state
         self.current_score = 0
-        self.session_stats = {
-            'start_time': None,
-            'words_attempted': 0,
-            'words_correct': 0,
-            'current_streak': 0,
-            'best_streak': 0,
-            'level_stats': {}
-        }
-          # Load scores and word history
+        self.session_stats = _new_session_stats(None, None)
+        
+        # Pending writes, flushed once per game by _batched_writes
+        self._dirty_history = False
+        self._dirty_session = False
+        
+        # Whether top_scores changed since it was last saved
+        self._scores_dirty = False
+        
+        # Load scores, finished sessions and word history
         self.top_scores = self._load_top_scores()
+        self.session_history = self._load_session_history(self.top_scores.pop('sessions', None))
         self.word_history = self._load_word_history()
         
+        # Pre-drawn adventure mode levels
+        self._level_queue = deque()
+        
+        # Answer indexes already built this run, keyed by the meanings they were built from
+        self._meaning_index_cache: Dict[Tuple[str, ...], MeaningIndex] = {}
+        
+        # Menu choice dispatch tables ('5'/'7' exit their menus)
+        self._main_menu_dispatch = {
+            '1': self._custom_mode,
+            '2': self._adventure_mode,
+            '3': self._view_statistics,
+            '4': self._settings_menu
+        }
+        self._settings_dispatch = {
+            '1': self._reset_statistics,
+            '2': self._clear_cache,
+            '3': self._export_statistics,
+            '4': self._reset_level,
+            '5': self._wipe_all_data,
+            '6': self._show_about
+        }
+        
     def _load_top_scores(self) -> Dict:
         """Load top scores from file"""
-        default_scores = {
-            'overall': 0,
-            'by_level': {
-                'a1': 0, 'a2': 0, 'b1': 0, 'b2': 0, 'c1': 0, 'c2': 0
-            },
-            'by_mode': {
-                'custom': 0,
-                'adventure': 0
-            },
-            'sessions': []
-        }
-        return load_json_file(self.scores_file, default_scores)
+        default_scores = _new_top_scores()
+        scores = load_json_file(self.scores_file, default_scores)
+        
+        # Older files may lack a section; fill it so callers can index directly
+        for key, value in default_scores.items():
+            scores.setdefault(key, value)
+        return scores
+    
+    def _load_session_history(self, legacy_sessions: Optional[List[Dict]] = None) -> deque:
+        """
+        Load the most recent finished sessions from the session log
+        
+        Args:
+            legacy_sessions: Sessions found in an older top_score.json, moved into the log
+        """
+        if legacy_sessions is not None:
+            if legacy_sessions:
+                logged = load_jsonl_file(self.sessions_file)
+                if logged:
+                    # Skip sessions already moved by an earlier, interrupted migration
+                    seen = {session.get('start_time') for session in logged}
+                    merged = logged + [s for s in legacy_sessions if s.get('start_time') not in seen]
+                    merged.sort(key=lambda session: session.get('start_time') or '')
+                    save_jsonl_file(self.sessions_file, merged)
+                else:
+                    append_jsonl_file(self.sessions_file, legacy_sessions)
+            
+            # Rewrite top_score.json without the sessions list
+            self._scores_dirty = True
+            self._save_scores()
+        
+        sessions = load_jsonl_file(self.sessions_file, limit=SESSION_HISTORY_LIMIT)
+        
+        # Appends make the log grow with every game; trim it once it gets large
+        try:
+            if os.path.getsize(self.sessions_file) > SESSION_LOG_COMPACT_BYTES:
+                save_jsonl_file(self.sessions_file, sessions)
+        except OSError:
+            pass  # No log yet
+        
+        return deque(sessions, maxlen=SESSION_HISTORY_LIMIT)
+    
+    def _clear_session_history(self):
+        """Forget all finished sessions and remove the session log"""
+        self.session_history.clear()
+        try:
+            os.remove(self.sessions_file)
+        except FileNotFoundError:
+            pass
     
     def _save_scores(self) -> bool:
-        """Save current scores to file"""
-        return save_json_file(self.scores_file, self.top_scores)
+        """Save current scores to file if they changed"""
+        if not self._scores_dirty:
+            return True
+        
+        success = save_json_file(self.scores_file, self.top_scores, skip_unchanged=True, compact=True)
+        if success:
+            self._scores_dirty = False
+        return success
     
-    def _save_session(self) -> bool:
+    def _save_session(self, timestamp: Optional[str] = None) -> bool:
         """Save current session data"""
         session_data = {
             'current_score': self.current_score,
             'stats': self.session_stats,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp or datetime.now().isoformat()
+        }
+        return save_json_file(self.session_file, session_data, compact=True)
+    
+    @staticmethod
+    def _build_word_history(recent_words=(), wrong_words=()) -> Dict:
+        """Build word history with bounded, newest-first deques"""
+        return {
+            'recent_words': deque(islice(recent_words, RECENT_WORDS_LIMIT), maxlen=RECENT_WORDS_LIMIT),
+            'wrong_words': deque(islice(wrong_words, WRONG_WORDS_LIMIT), maxlen=WRONG_WORDS_LIMIT)
         }
-        return save_json_file(self.session_file, session_data)
     
     def _load_word_history(self) -> Dict:
         """Load word history from file"""
         history_file = os.path.join(self.scores_dir, 'word_history.json')
-        default_history = {
-            'recent_words': [],  # List of recent words that appeared in games
-            'wrong_words': []    # List of words that were answered incorrectly
-        }
-        return load_json_file(history_file, default_history)
+        loaded = load_json_file(history_file)
+        
+        # Defaults stay in memory only; the file is first written once a word is recorded
+        self._word_history_loaded_from_disk = bool(loaded)
+        return self._build_word_history(loaded.get('recent_words', []), loaded.get('wrong_words', []))
     
     def _save_word_history(self) -> bool:
         """Save word history to file"""
+        recent_words = self.word_history['recent_words']
+        wrong_words = self.word_history['wrong_words']
+        if not self._word_history_loaded_from_disk and not recent_words and not wrong_words:
+            # Nothing recorded and nothing on disk to overwrite
+            return True
+        
         history_file = os.path.join(self.scores_dir, 'word_history.json')
-        return save_json_file(history_file, self.word_history)
+        history_data = {
+            'recent_words': list(recent_words),
+            'wrong_words': list(wrong_words)
+        }
+        success = save_json_file(history_file, history_data, compact=True)
+        if success:
+            self._word_history_loaded_from_disk = True
+        return success
     
-    def _add_word_to_history(self, word: str, word_class: str, level: str, is_correct: bool, meanings: List[str]):
+    def _add_word_to_history(self, word: str, word_class: str, level: str, is_correct: bool, meanings: List[str],
+                             timestamp: Optional[str] = None):
         """Add word to history tracking"""
         word_entry = {
             'word': word,
             'class': word_class,
             'level': level,
             'meanings': meanings,
-            'timestamp': datetime.now().isoformat()
+            'timestamp': timestamp or datetime.now().isoformat()
         }
         
-        # Add to recent words (keep last 50)
-        self.word_history['recent_words'].insert(0, word_entry)
-        if len(self.word_history['recent_words']) > 50:
-            self.word_history['recent_words'] = self.word_history['recent_words'][:50]
+        # Add to recent words (deque keeps the last 50)
+        self.word_history['recent_words'].appendleft(word_entry)
         
-        # Add to wrong words if incorrect (keep last 100)
+        # Add to wrong words if incorrect (deque keeps the last 100)
         if not is_correct:
-            self.word_history['wrong_words'].insert(0, word_entry)
-            if len(self.word_history['wrong_words']) > 100:
-                self.word_history['wrong_words'] = self.word_history['wrong_words'][:100]
+            self.word_history['wrong_words'].appendleft(word_entry)
         
-        self._save_word_history()
+        self._dirty_history = True
+    
+    def _flush_pending_writes(self):
+        """Write word history and session data if they changed since the last flush"""
+        if self._dirty_history:
+            self._save_word_history()
+            self._dirty_history = False
+        if self._dirty_session:
+            self._save_session()
+            self._dirty_session = False
+    
+    @contextmanager
+    def _batched_writes(self):
+        """Defer history/session saves until the block exits, even on errors"""
+        try:
+            yield
+        finally:
+            self._flush_pending_writes()
     
     def start_game_menu(self):
         """Display main game menu"""
@@ -118,41 +356,31 @@ class OxfordVocabGame:
             clear_screen()
             print_header("🎓 Oxford Vocabulary Trainer 🎓", 60)
             
-            print(f"{Colors.INFO}Welcome to the AI-powered vocabulary learning game!{Colors.RESET}")
-            print(f"{Colors.INFO}Master Oxford 3000 words with intelligent AI translations.{Colors.RESET}\n")
+            lines = [_MAIN_MENU_INTRO]
             
             # Display current top scores
-            overall_score = self.top_scores.get('overall', 0)
-            print(f"{Colors.SUCCESS}🏆 Overall Top Score: {overall_score}{Colors.RESET}")
+            overall_score = self.top_scores['overall']
+            lines.append(f"{Colors.SUCCESS}🏆 Overall Top Score: {overall_score}{Colors.RESET}")
             
             # Display level scores
-            level_scores = self.top_scores.get('by_level', {})
-            print(f"\n{Colors.INFO}📊 Best Scores by Level:{Colors.RESET}")
-            for level in ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']:
+            level_scores = self.top_scores['by_level']
+            lines.append(f"\n{Colors.INFO}📊 Best Scores by Level:{Colors.RESET}")
+            for level in LEVELS:
                 score = level_scores.get(level, 0)
-                description = get_level_description(level).split(' - ')[0]
-                print(f"   {level.upper()}: {score:2d} ({description})")
+                lines.append(f"   {level.upper()}: {score:2d} ({LEVEL_SHORT_DESC[level]})")
             
-            print(f"\n{Colors.WARNING}Choose your game mode:{Colors.RESET}")
-            print("1. 🎯 Custom Mode (Choose specific level)")
-            print("2. 🎲 Adventure Mode (Random levels A1-C1)")
-            print("3. 📈 View Statistics")
-            print("4. ⚙️  Settings")
-            print("5. ❌ Exit")
+            lines.append(_MAIN_MENU_OPTIONS)
+            print_block(lines)
             
-            choice = input(f"\n{Colors.BOLD}Enter your choice (1-5): {Colors.RESET}").strip()
+            choice = input(_MAIN_MENU_PROMPT).strip()
             
-            if choice == '1':
-                self._custom_mode()
-            elif choice == '2':
-                self._adventure_mode()
-            elif choice == '3':
-                self._view_statistics()
-            elif choice == '4':
-                self._settings_menu()
-            elif choice == '5':
+            if choice == '5':
                 print_info("Thanks for playing! Keep learning! 📚")
                 break
+            
+            action = self._main_menu_dispatch.get(choice)
+            if action:
+                action()
             else:
                 print_error("Invalid choice. Please try again.")
                 time.sleep(1)
@@ -164,12 +392,13 @@ class OxfordVocabGame:
         
         print(f"{Colors.INFO}Choose your difficulty level:{Colors.RESET}\n")
         
-        levels = ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']
-        for i, level in enumerate(levels, 1):
+        level_scores = self.top_scores['by_level']
+        warning, reset = Colors.WARNING, Colors.RESET
+        for i, level in enumerate(LEVELS, 1):
             description = get_level_description(level)
-            top_score = self.top_scores.get('by_level', {}).get(level, 0)
+            top_score = level_scores.get(level, 0)
             if level == 'c2':
-                print(f"{i}. {level.upper()} - {description} (Best: {top_score}) {Colors.WARNING}[Not available in Oxford 5000]{Colors.RESET}")
+                print(f"{i}. {level.upper()} - {description} (Best: {top_score}) {warning}[Not available in Oxford 5000]{reset}")
             else:
                 print(f"{i}. {level.upper()} - {description} (Best: {top_score})")
         
@@ -182,8 +411,8 @@ class OxfordVocabGame:
                 return
             
             level_index = int(choice) - 1
-            if 0 <= level_index < len(levels):
-                selected_level = levels[level_index]
+            if 0 <= level_index < len(LEVELS):
+                selected_level = LEVELS[level_index]
                 print_info(f"Starting Custom Mode with level {selected_level.upper()}")
                 self._play_game(selected_level, 'custom')
             else:
@@ -201,13 +430,41 @@ class OxfordVocabGame:
         print(f"{Colors.INFO}Adventure Mode - Random levels from A1 to C1!{Colors.RESET}")
         print(f"{Colors.WARNING}Each word will be from a random level to keep you on your toes!{Colors.RESET}\n")
         
-        top_score = self.top_scores.get('by_mode', {}).get('adventure', 0)
+        top_score = self.top_scores['by_mode'].get('adventure', 0)
         print(f"{Colors.SUCCESS}🏆 Adventure Mode Best Score: {top_score}{Colors.RESET}")
         
         input(f"\n{Colors.BOLD}Press Enter to start the adventure...{Colors.RESET}")
         print_info("Starting Adventure Mode!")
         self._play_game(None, 'adventure')  # None level means random selection
     
+    def _translate(self, word: str, word_class: str) -> Tuple[List[str], Optional[MeaningIndex]]:
+        """
+        Translate a word and get the answer index for its meanings
+        
+        Returns:
+            Tuple of (meanings, answer index), with a None index when there are no meanings
+        """
+        # The translator caches real translations itself and retries after fallbacks,
+        # so only the index built from the meanings is memoized here
+        meanings = self.translator.translate_word(word, word_class)
+        if not meanings:
+            return meanings, None
+        
+        key = tuple(meanings)
+        meaning_index = self._meaning_index_cache.get(key)
+        if meaning_index is None:
+            meaning_index = precompute_meaning_index(meanings)
+            if len(self._meaning_index_cache) >= MEANING_INDEX_MEMO_LIMIT:
+                del self._meaning_index_cache[next(iter(self._meaning_index_cache))]
+            self._meaning_index_cache[key] = meaning_index
+        return meanings, meaning_index
+    
+    def _next_adventure_level(self) -> str:
+        """Pop the next random adventure level, refilling the queue in batches"""
+        if not self._level_queue:
+            self._level_queue.extend(random.choices(ADVENTURE_LEVELS, k=LEVEL_BATCH_SIZE))
+        return self._level_queue.popleft()
+    
     def _play_game(self, level: Optional[str], mode: str):
         """
         Main game loop
@@ -217,175 +474,183 @@ class OxfordVocabGame:
         """
         # Initialize session
         self.current_score = 0
-        self.session_stats = {
-            'start_time': datetime.now().isoformat(),
-            'words_attempted': 0,
-            'words_correct': 0,
-            'current_streak': 0,
-            'best_streak': 0,
-            'level_stats': {},
-            'wrong_answers': [],  # Store wrong answer details
-            'mode': mode,
-            'target_level': level        }
+        self.session_stats = _new_session_stats(mode, level)
         
         print_info(f"Game started! Mode: {mode.title()}, Level: {level.upper() if level else 'Random A1-C1'}")
         
-        while True:
-            # Select word based on mode
-            if mode == 'adventure':
-                # Random level selection for adventure mode (A1-C1)
-                adventure_levels = ['a1', 'a2', 'b1', 'b2', 'c1']
-                current_level = random.choice(adventure_levels)
-                word_data = self.word_picker.get_weighted_word(current_level)
-            else:
-                # Fixed level for custom mode
-                current_level = level
-                word_data = self.word_picker.get_weighted_word(level)
-            
-            if not word_data:
-                print_error(f"No words available for level: {current_level or 'adventure'}")
-                break
-            
-            word, word_class, word_level = word_data
-            
-            # Update level stats
-            if word_level not in self.session_stats['level_stats']:
-                self.session_stats['level_stats'][word_level] = {
-                    'attempted': 0, 'correct': 0
-                }
-            
-            # Display word
-            clear_screen()
-            current_top_score = self.top_scores.get('overall', 0)
-            if mode == 'custom' and level:
-                current_top_score = self.top_scores.get('by_level', {}).get(level, 0)
-            elif mode == 'adventure':
-                current_top_score = self.top_scores.get('by_mode', {}).get('adventure', 0)
-            
-            display_game_stats(self.current_score, current_top_score, word_level)
-            
-            print(format_word_display(word, word_class, word_level))
-            
-            # Get translation from AI
-            print_info("🤖 AI is translating the word...")
-            try:
-                possible_meanings = self.translator.translate_word(word, word_class)
+        # Top scores only change in _end_game, so the one shown is fixed for this game
+        if mode == 'custom' and level:
+            current_top_score = self.top_scores['by_level'].get(level, 0)
+        elif mode == 'adventure':
+            current_top_score = self.top_scores['by_mode'].get('adventure', 0)
+        else:
+            current_top_score = self.top_scores['overall']
+        
+        # Answers, commands and meanings are all compared in casefolded form
+        normalize = str.casefold
+        
+        # Methods called on every turn
+        pick_word = self.word_picker.get_weighted_word
+        record_results = self.word_picker.apply_results
+        
+        with self._batched_writes():
+            while True:
+                # Select word based on mode
+                if mode == 'adventure':
+                    # Random level selection for adventure mode (A1-C1)
+                    current_level = self._next_adventure_level()
+                    word_data = pick_word(current_level)
+                else:
+                    # Fixed level for custom mode
+                    current_level = level
+                    word_data = pick_word(level)
                 
-                if not possible_meanings:
-                    print_error("Failed to get translation. Skipping word...")
-                    continue
+                if not word_data:
+                    print_error(f"No words available for level: {current_level or 'adventure'}")
+                    break
                 
-            except Exception as e:
-                print_error(f"Translation error: {e}")
-                print_warning("Using fallback translation...")
-                possible_meanings = [f"[Translation for '{word}']"]
-              # Get user input
-            print(f"\n{Colors.BOLD}What is the meaning of this word in Indonesian?{Colors.RESET}")
-            print(f"{Colors.INFO}(Type 'hint' for a clue, 'skip' to skip, 'quit' to end game){Colors.RESET}")
-            
-            user_answer = input(f"\n{Colors.BOLD}Your answer: {Colors.RESET}").strip()
-            
-            # Handle special commands
-            if user_answer.lower() == 'quit':
-                self._end_game(mode, level)
-                return
-            elif user_answer.lower() == 'skip':
-                print_warning(f"Skipped! Possible meanings: {', '.join(possible_meanings[:3])}")
+                word, word_class, word_level = word_data
                 
-                # Store skipped word details
-                wrong_answer_detail = {
-                    'word': word,
-                    'class': word_class,
-                    'level': word_level,
-                    'user_answer': '[SKIPPED]',                    'correct_meanings': possible_meanings
-                }
-                self.session_stats['wrong_answers'].append(wrong_answer_detail)
+                # Display word
+                clear_screen()
+                display_game_stats(self.current_score, current_top_score, word_level)
                 
-                self.word_picker.update_word_performance(word, word_class, word_level, False)
-                self._add_word_to_history(word, word_class, word_level, False, possible_meanings)
-                self._update_session_stats(word_level, False)
-                input(f"\n{Colors.INFO}Press Enter to continue...{Colors.RESET}")
-                continue
-            elif user_answer.lower() == 'hint':
-                # Show first letter of first meaning
-                if possible_meanings:
-                    hint = possible_meanings[0][:2] + "..."
-                    print(f"{Colors.WARNING}Hint: {hint}{Colors.RESET}")
-                    user_answer = input(f"\n{Colors.BOLD}Your answer: {Colors.RESET}").strip()
-                else:
-                    print_warning("No hint available")
-                    continue
-            
-            # Validate answer
-            is_correct = validate_user_input(user_answer, possible_meanings)
-            
-            if is_correct:
-                # Correct answer
-                self.current_score += 1
-                self.session_stats['current_streak'] += 1
+                print(format_word_display(word, word_class, word_level))
+                
+                # Get translation from AI
+                print_info("🤖 AI is translating the word...")
+                try:
+                    possible_meanings, meaning_index = self._translate(word, word_class)
                 
-                # Update session stats
-                self._update_session_stats(word_level, True)
+                    if not possible_meanings:
+                        print_error("Failed to get translation. Skipping word...")
+                        continue
                 
-                if self.session_stats['current_streak'] > self.session_stats['best_streak']:
-                    self.session_stats['best_streak'] = self.session_stats['current_streak']
+                except Exception as e:
+                    print_error(f"Translation error: {e}")
+                    print_warning("Using fallback translation...")
+                    possible_meanings = [f"[Translation for '{word}']"]
+                    meaning_index = precompute_meaning_index(possible_meanings)
                 
-                print_success(f"Correct! 🎉 Score: {self.current_score}")
-                print_info(f"Possible meanings: {', '.join(possible_meanings[:5])}")
+                # Get user input
+                print(_QUESTION_TEXT)
                 
-                # Update word performance
-                self.word_picker.update_word_performance(word, word_class, word_level, True)
+                user_answer = input(_ANSWER_PROMPT).strip()
+                turn_ts = datetime.now().isoformat()
                 
-                # Add word to history
-                self._add_word_to_history(word, word_class, word_level, True, possible_meanings)
+                # Handle special commands
+                command = normalize(user_answer)
+                if command in GAME_COMMANDS:
+                    if command == 'quit':
+                        self._end_game(mode, level)
+                        return
+                    if command == 'skip':
+                        self._skip_word(word, word_class, word_level, possible_meanings, turn_ts)
+                        continue
+                    user_answer = self._answer_with_hint(possible_meanings)
+                    if user_answer is None:
+                        continue
+                    command = normalize(user_answer)
                 
-                # Save session after each correct answer
-                self._save_session()
+                # Validate answer (exact matches first, then word matching)
+                is_correct = validate_user_input(command, meaning_index)
                 
-                input(f"\n{Colors.SUCCESS}Press Enter to continue...{Colors.RESET}")
+                if is_correct:
+                    # Correct answer
+                    self.current_score += 1
+                    self.session_stats['current_streak'] += 1
                 
-            else:
-                # Wrong answer - Game Over
-                print_error(f"❌ Game Over! Your answer: '{user_answer}'")
-                print_info(f"Correct meanings were: {', '.join(possible_meanings)}")
+                    # Update session stats
+                    self._update_session_stats(word_level, True)
                 
-                # Store wrong answer details
-                wrong_answer_detail = {
-                    'word': word,
-                    'class': word_class,
-                    'level': word_level,
-                    'user_answer': user_answer,
-                    'correct_meanings': possible_meanings
-                }
-                self.session_stats['wrong_answers'].append(wrong_answer_detail)
+                    if self.session_stats['current_streak'] > self.session_stats['best_streak']:
+                        self.session_stats['best_streak'] = self.session_stats['current_streak']
                 
-                # Reset current streak
-                self.session_stats['current_streak'] = 0
-                  # Update word performance
-                self.word_picker.update_word_performance(word, word_class, word_level, False)
-                self._add_word_to_history(word, word_class, word_level, False, possible_meanings)
-                self._update_session_stats(word_level, False)
+                    print_success(f"Correct! 🎉 Score: {self.current_score}")
+                    print_info(f"Possible meanings: {', '.join(possible_meanings[:5])}")
                 
-                # End game
-                self._end_game(mode, level)
-                return
+                    # Update word performance
+                    record_results([(word, word_class, word_level, True)])
+                
+                    # Add word to history
+                    self._add_word_to_history(word, word_class, word_level, True, possible_meanings, turn_ts)
+                
+                    # Mark session for saving at the end of the game
+                    self._dirty_session = True
+                
+                    input(_CORRECT_CONTINUE_PROMPT)
+                
+                else:
+                    # Wrong answer - Game Over
+                    print_error(f"❌ Game Over! Your answer: '{user_answer}'")
+                    print_info(f"Correct meanings were: {', '.join(possible_meanings)}")
+                
+                    # Store wrong answer details
+                    wrong_answer_detail = {
+                        'word': word,
+                        'class': word_class,
+                        'level': word_level,
+                        'user_answer': user_answer,
+                        'correct_meanings': possible_meanings
+                    }
+                    self.session_stats['wrong_answers'].append(wrong_answer_detail)
+                
+                    # Reset current streak
+                    self.session_stats['current_streak'] = 0
+                      # Update word performance
+                    record_results([(word, word_class, word_level, False)])
+                    self._add_word_to_history(word, word_class, word_level, False, possible_meanings, turn_ts)
+                    self._update_session_stats(word_level, False)
+                
+                    # End game
+                    self._end_game(mode, level)
+                    return
+    
+    def _skip_word(self, word: str, word_class: str, word_level: str, possible_meanings: List[str], timestamp: str):
+        """Record a skipped word as a wrong answer"""
+        print_warning(f"Skipped! Possible meanings: {', '.join(possible_meanings[:3])}")
+        
+        # Store skipped word details
+        wrong_answer_detail = {
+            'word': word,
+            'class': word_class,
+            'level': word_level,
+            'user_answer': '[SKIPPED]',
+            'correct_meanings': possible_meanings
+        }
+        self.session_stats['wrong_answers'].append(wrong_answer_detail)
+        
+        self.word_picker.apply_results([(word, word_class, word_level, False)])
+        self._add_word_to_history(word, word_class, word_level, False, possible_meanings, timestamp)
+        self._update_session_stats(word_level, False)
+        input(_CONTINUE_PROMPT)
+    
+    def _answer_with_hint(self, possible_meanings: List[str]) -> Optional[str]:
+        """Show a hint and ask again; returns None when no hint is available"""
+        if not possible_meanings:
+            print_warning("No hint available")
+            return None
+        
+        # Show first letters of first meaning
+        hint = possible_meanings[0][:2] + "..."
+        print(f"{Colors.WARNING}Hint: {hint}{Colors.RESET}")
+        return input(_ANSWER_PROMPT).strip()
     
     def _update_session_stats(self, word_level: str, is_correct: bool):
         """Update session statistics"""
-        if word_level not in self.session_stats['level_stats']:
-            self.session_stats['level_stats'][word_level] = {
-                'attempted': 0, 'correct': 0
-            }
+        level_stats = self.session_stats['level_stats'].setdefault(word_level, {'attempted': 0, 'correct': 0})
         
         self.session_stats['words_attempted'] += 1
-        self.session_stats['level_stats'][word_level]['attempted'] += 1
+        level_stats['attempted'] += 1
         
         if is_correct:
             self.session_stats['words_correct'] += 1
-            self.session_stats['level_stats'][word_level]['correct'] += 1
+            level_stats['correct'] += 1
     
     def _end_game(self, mode: str, level: Optional[str]):
         """Handle game end and score saving"""
+        self._flush_pending_writes()
+        
         clear_screen()
         print_header("🎮 Game Over", 50)
         
@@ -395,19 +660,19 @@ class OxfordVocabGame:
         new_records = []
         
         # Overall high score
-        if self.current_score > self.top_scores.get('overall', 0):
+        if self.current_score > self.top_scores['overall']:
             self.top_scores['overall'] = self.current_score
             new_records.append("Overall High Score! 🏆")
         
         # Level-specific high score
         if mode == 'custom' and level:
-            level_scores = self.top_scores.setdefault('by_level', {})
+            level_scores = self.top_scores['by_level']
             if self.current_score > level_scores.get(level, 0):
                 level_scores[level] = self.current_score
                 new_records.append(f"New {level.upper()} Level Record! 🎯")
         
         # Mode-specific high score
-        mode_scores = self.top_scores.setdefault('by_mode', {})
+        mode_scores = self.top_scores['by_mode']
         if self.current_score > mode_scores.get(mode, 0):
             mode_scores[mode] = self.current_score
             new_records.append(f"New {mode.title()} Mode Record! 🎲")
@@ -422,24 +687,26 @@ class OxfordVocabGame:
         self.session_stats['end_time'] = datetime.now().isoformat()
         self.session_stats['final_score'] = self.current_score
         
-        sessions = self.top_scores.setdefault('sessions', [])
-        sessions.append(self.session_stats.copy())
-        
-        # Keep only last 20 sessions
-        if len(sessions) > 20:
-            sessions = sessions[-20:]
-            self.top_scores['sessions'] = sessions
+        # The deque keeps only the last SESSION_HISTORY_LIMIT sessions. No copy is
+        # needed: the next game assigns a fresh session_stats dict.
+        self.session_history.append(self.session_stats)
+        append_jsonl_file(self.sessions_file, [self.session_stats])
         
         # Save all scores
+        if new_records:
+            self._scores_dirty = True
         self._save_scores()
           # Display session stats
         self._display_session_summary()
         
-        input(f"\n{Colors.INFO}Press Enter to return to main menu...{Colors.RESET}")
+        input(_RETURN_TO_MENU_PROMPT)
     
     def _display_session_summary(self):
         """Display detailed session summary"""
-        print(f"\n{Colors.INFO}📊 Session Summary:{Colors.RESET}")
+        info, warning, success, error = Colors.INFO, Colors.WARNING, Colors.SUCCESS, Colors.ERROR
+        bold, reset = Colors.BOLD, Colors.RESET
+        
+        print(f"\n{info}📊 Session Summary:{reset}")
         print(f"   Words Attempted: {self.session_stats['words_attempted']}")
         print(f"   Words Correct: {self.session_stats['words_correct']}")
         print(f"   Best Streak: {self.session_stats['best_streak']}")
@@ -449,7 +716,7 @@ class OxfordVocabGame:
             print(f"   Accuracy: {accuracy:.1f}%")
           # Level breakdown
         if self.session_stats['level_stats']:
-            print(f"\n{Colors.INFO}📈 Performance by Level:{Colors.RESET}")
+            print(f"\n{info}📈 Performance by Level:{reset}")
             for level, stats in self.session_stats['level_stats'].items():
                 if stats['attempted'] > 0:
                     level_accuracy = (stats['correct'] / stats['attempted']) * 100
@@ -457,7 +724,7 @@ class OxfordVocabGame:
         
         # Wrong answers breakdown
         if self.session_stats['wrong_answers']:
-            print(f"\n{Colors.WARNING}❌ Words You Got Wrong:{Colors.RESET}")
+            print(f"\n{warning}❌ Words You Got Wrong:{reset}")
             for i, wrong in enumerate(self.session_stats['wrong_answers'], 1):
                 word = wrong['word']
                 word_class = wrong['class']
@@ -468,78 +735,78 @@ class OxfordVocabGame:
                 # Format correct meanings (show all)
                 correct_display = ', '.join(correct_meanings)
                 
-                print(f"   {i}. {Colors.BOLD}{word.title()}{Colors.RESET} ({word_class}, {level.upper()})")
+                print(f"   {i}. {bold}{word.title()}{reset} ({word_class}, {level.upper()})")
                 if user_answer == '[SKIPPED]':
-                    print(f"      Your answer: {Colors.WARNING}SKIPPED{Colors.RESET}")
+                    print(f"      Your answer: {warning}SKIPPED{reset}")
                 else:
-                    print(f"      Your answer: {Colors.ERROR}'{user_answer}'{Colors.RESET}")
-                print(f"      Correct: {Colors.SUCCESS}{correct_display}{Colors.RESET}")
+                    print(f"      Your answer: {error}'{user_answer}'{reset}")
+                print(f"      Correct: {success}{correct_display}{reset}")
                 if i < len(self.session_stats['wrong_answers']):
                     print()  # Add blank line between entries except for last one
     
     def _view_statistics(self):
         """Display comprehensive statistics"""
+        info, warning, success, reset = Colors.INFO, Colors.WARNING, Colors.SUCCESS, Colors.RESET
+        
         clear_screen()
         print_header("📊 Statistics", 60)
         
         # Overall stats
-        print(f"{Colors.INFO}🏆 High Scores:{Colors.RESET}")
-        print(f"   Overall: {self.top_scores.get('overall', 0)}")
+        lines = [f"{info}🏆 High Scores:{reset}"]
+        lines.append(f"   Overall: {self.top_scores['overall']}")
         
-        mode_scores = self.top_scores.get('by_mode', {})
-        print(f"   Custom Mode: {mode_scores.get('custom', 0)}")
-        print(f"   Adventure Mode: {mode_scores.get('adventure', 0)}")
+        mode_scores = self.top_scores['by_mode']
+        lines.append(f"   Custom Mode: {mode_scores.get('custom', 0)}")
+        lines.append(f"   Adventure Mode: {mode_scores.get('adventure', 0)}")
         
         # Level stats
-        print(f"\n{Colors.INFO}📈 Level High Scores:{Colors.RESET}")
-        level_scores = self.top_scores.get('by_level', {})
-        for level in ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']:
+        lines.append(f"\n{info}📈 Level High Scores:{reset}")
+        level_scores = self.top_scores['by_level']
+        for level in LEVELS:
             score = level_scores.get(level, 0)
-            description = get_level_description(level).split(' - ')[0]
-            print(f"   {level.upper()}: {score:2d} ({description})")
+            lines.append(f"   {level.upper()}: {score:2d} ({LEVEL_SHORT_DESC[level]})")
         
         # Recent sessions
-        sessions = self.top_scores.get('sessions', [])
+        sessions = self.session_history
         if sessions:
-            print(f"\n{Colors.INFO}📅 Recent Sessions (Last 5):{Colors.RESET}")
-            for i, session in enumerate(sessions[-5:], 1):
+            lines.append(f"\n{info}📅 Recent Sessions (Last 5):{reset}")
+            for i, session in enumerate(islice(sessions, max(len(sessions) - 5, 0), None), 1):
                 score = session.get('final_score', 0)
                 mode = session.get('mode', 'unknown')
                 level = session.get('target_level', 'random')
-                accuracy = 0
-                if session.get('words_attempted', 0) > 0:
-                    accuracy = (session.get('words_correct', 0) / session['words_attempted']) * 100
+                attempted = session.get('words_attempted', 0)
+                accuracy = session.get('words_correct', 0) / attempted * 100 if attempted else 0.0
                 
-                print(f"   {i}. Score: {score:2d} | Mode: {mode:9s} | Level: {level or 'random':6s} | Accuracy: {accuracy:5.1f}%")
+                lines.append(f"   {i}. Score: {score:2d} | Mode: {mode:9s} | Level: {level or 'random':6s} | Accuracy: {accuracy:5.1f}%")
           # Word picker statistics
-        print(f"\n{Colors.INFO}🎯 Learning Progress:{Colors.RESET}")
-        for level in ['a1', 'a2', 'b1', 'b2', 'c1']:
+        lines.append(f"\n{info}🎯 Learning Progress:{reset}")
+        for level in ADVENTURE_LEVELS:
             level_stats = self.word_picker.get_level_statistics(level)
             mastery = level_stats.get('mastery_level', 0)
             avg_accuracy = level_stats.get('average_accuracy', 0)
             total_words = level_stats.get('total_words', 0)
             
             if total_words > 0:  # Only show levels that have words
-                print(f"   {level.upper()}: {total_words:4d} words | Mastery: {mastery:5.1f}% | Avg Accuracy: {avg_accuracy:5.1f}%")
+                lines.append(f"   {level.upper()}: {total_words:4d} words | Mastery: {mastery:5.1f}% | Avg Accuracy: {avg_accuracy:5.1f}%")
         
         # Difficult words
         difficult_words = self.word_picker.get_difficult_words(limit=5)
         if difficult_words:
-            print(f"\n{Colors.WARNING}🔥 Words Needing Practice:{Colors.RESET}")
+            lines.append(f"\n{warning}🔥 Words Needing Practice:{reset}")
             for word_info in difficult_words:
-                print(f"   {word_info['word']:12s} ({word_info['level'].upper()}) - Accuracy: {word_info['accuracy']:5.1f}%")
+                lines.append(f"   {word_info['word']:12s} ({word_info['level'].upper()}) - Accuracy: {word_info['accuracy']:5.1f}%")
           # Mastered words
         mastered_words = self.word_picker.get_mastered_words(limit=5)
         if mastered_words:
-            print(f"\n{Colors.SUCCESS}✅ Recently Mastered Words:{Colors.RESET}")
+            lines.append(f"\n{success}✅ Recently Mastered Words:{reset}")
             for word_info in mastered_words:
-                print(f"   {word_info['word']:12s} ({word_info['level'].upper()}) - Accuracy: {word_info['accuracy']:5.1f}%")
+                lines.append(f"   {word_info['word']:12s} ({word_info['level'].upper()}) - Accuracy: {word_info['accuracy']:5.1f}%")
         
         # Recent words that appeared in games
         recent_words = self.word_history.get('recent_words', [])
         if recent_words:
-            print(f"\n{Colors.INFO}🕐 Recently Appeared Words (Last 10):{Colors.RESET}")
-            for i, word_entry in enumerate(recent_words[:10], 1):
+            lines.append(f"\n{info}🕐 Recently Appeared Words (Last 10):{reset}")
+            for i, word_entry in enumerate(islice(recent_words, 10), 1):
                 word = word_entry['word']
                 word_class = word_entry['class']
                 level = word_entry['level']
@@ -547,13 +814,13 @@ class OxfordVocabGame:
                 meanings_display = ', '.join(meanings[:3])
                 if len(meanings) > 3:
                     meanings_display += f" (+{len(meanings) - 3} more)"
-                print(f"   {i:2d}. {word:12s} ({word_class}, {level.upper()}) - {meanings_display}")
+                lines.append(f"   {i:2d}. {word:12s} ({word_class}, {level.upper()}) - {meanings_display}")
         
         # Words that were answered incorrectly
         wrong_words = self.word_history.get('wrong_words', [])
         if wrong_words:
-            print(f"\n{Colors.WARNING}❌ Recently Missed Words (Last 10):{Colors.RESET}")
-            for i, word_entry in enumerate(wrong_words[:10], 1):
+            lines.append(f"\n{warning}❌ Recently Missed Words (Last 10):{reset}")
+            for i, word_entry in enumerate(islice(wrong_words, 10), 1):
                 word = word_entry['word']
                 word_class = word_entry['class']
                 level = word_entry['level']
@@ -561,8 +828,10 @@ class OxfordVocabGame:
                 meanings_display = ', '.join(meanings[:3])
                 if len(meanings) > 3:
                     meanings_display += f" (+{len(meanings) - 3} more)"
-                print(f"   {i:2d}. {word:12s} ({word_class}, {level.upper()}) - {meanings_display}")        
-        input(f"\n{Colors.INFO}Press Enter to return to main menu...{Colors.RESET}")
+                lines.append(f"   {i:2d}. {word:12s} ({word_class}, {level.upper()}) - {meanings_display}")
+        
+        print_block(lines)
+        input(_RETURN_TO_MENU_PROMPT)
     
     def _settings_menu(self):
         """Settings and configuration menu"""
@@ -570,30 +839,16 @@ class OxfordVocabGame:
             clear_screen()
             print_header("⚙️ Settings", 50)
             
-            print("1. 🔄 Reset All Statistics")
-            print("2. 🧹 Clear Translation Cache")
-            print("3. 📊 Export Statistics")
-            print("4. 🎯 Reset Specific Level")
-            print("5. 🗑️  Wipe All Data (Factory Reset)")
-            print("6. ℹ️  About")
-            print("7. ↩️  Back to Main Menu")
+            print(_SETTINGS_MENU_OPTIONS)
             
-            choice = input(f"\n{Colors.BOLD}Choose option (1-7): {Colors.RESET}").strip()
+            choice = input(_SETTINGS_MENU_PROMPT).strip()
             
-            if choice == '1':
-                self._reset_statistics()
-            elif choice == '2':
-                self._clear_cache()
-            elif choice == '3':
-                self._export_statistics()
-            elif choice == '4':
-                self._reset_level()
-            elif choice == '5':
-                self._wipe_all_data()
-            elif choice == '6':
-                self._show_about()
-            elif choice == '7':
+            if choice == '7':
                 return
+            
+            action = self._settings_dispatch.get(choice)
+            if action:
+                action()
             else:
                 print_error("Invalid choice. Please try again.")
                 time.sleep(1)
@@ -607,14 +862,11 @@ class OxfordVocabGame:
             # Reset word picker stats
             self.word_picker.reset_all_stats()
             
-            # Reset scores
-            self.top_scores = {
-                'overall': 0,
-                'by_level': {'a1': 0, 'a2': 0, 'b1': 0, 'b2': 0, 'c1': 0, 'c2': 0},
-                'by_mode': {'custom': 0, 'adventure': 0},
-                'sessions': []
-            }
+            # Reset scores and session history
+            self.top_scores = _new_top_scores()
+            self._scores_dirty = True
             self._save_scores()
+            self._clear_session_history()
             
             print_success("All statistics have been reset!")
         else:
@@ -625,6 +877,7 @@ class OxfordVocabGame:
     def _clear_cache(self):
         """Clear translation cache"""
         self.translator.clear_cache()
+        self._meaning_index_cache.clear()
         cache_stats = self.translator.get_cache_stats()
         print_success(f"Translation cache cleared! Was caching {cache_stats['cache_size']} translations.")
         time.sleep(2)
@@ -634,7 +887,7 @@ class OxfordVocabGame:
         try:
             export_data = {
                 'export_time': datetime.now().isoformat(),
-                'game_scores': self.top_scores,
+                'game_scores': {**self.top_scores, 'sessions': list(self.session_history)},
                 'word_statistics': self.word_picker.export_statistics(),
                 'cache_stats': self.translator.get_cache_stats()
             }
@@ -653,20 +906,20 @@ class OxfordVocabGame:
     def _reset_level(self):
         """Reset statistics for specific level"""
         print("Choose level to reset:")
-        levels = ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']
-        
-        for i, level in enumerate(levels, 1):
+        for i, level in enumerate(LEVELS, 1):
             print(f"{i}. {level.upper()}")
         
         try:
             choice = int(input(f"\n{Colors.BOLD}Choose level (1-6): {Colors.RESET}")) - 1
-            if 0 <= choice < len(levels):
-                level = levels[choice]
+            if 0 <= choice < len(LEVELS):
+                level = LEVELS[choice]
                 confirm = input(f"{Colors.WARNING}Reset {level.upper()} statistics? (y/N): {Colors.RESET}").strip().lower()
                 
                 if confirm == 'y':
                     # Reset level high score
-                    self.top_scores['by_level'][level] = 0
+                    if self.top_scores['by_level'].get(level, 0):
+                        self.top_scores['by_level'][level] = 0
+                        self._scores_dirty = True
                     self._save_scores()
                     print_success(f"Reset {level.upper()} statistics!")
                 else:
@@ -683,42 +936,7 @@ class OxfordVocabGame:
         clear_screen()
         print_header("ℹ️ About Oxford Vocabulary Trainer", 60)
         
-        print(f"{Colors.INFO}🎓 Oxford Vocabulary Trainer{Colors.RESET}")
-        print(f"   AI-powered vocabulary learning game")
-        print(f"   Version: 1.2.0")
-        print(f"   Author: Rafi Project")
-        print()
-        print(f"{Colors.INFO}🤖 AI Features:{Colors.RESET}")
-        print(f"   • LLaMA 3.1 8B Instant via Groq API for contextual translations")
-        print(f"   • Advanced caching with persistent storage")
-        print(f"   • Adaptive learning with weighted word selection")
-        print(f"   • Smart answer validation (complete word matching)")
-        print()
-        print(f"{Colors.INFO}📚 Data Source:{Colors.RESET}")
-        print(f"   • Oxford 3000 & 5000 most important English words")
-        print(f"   • CEFR levels (A1, A2, B1, B2, C1, C2)")
-        print(f"   • Part of speech classification")
-        print()
-        print(f"{Colors.INFO}🎮 Game Modes:{Colors.RESET}")
-        print(f"   • Custom Mode: Choose specific CEFR level")
-        print(f"   • Adventure Mode: Random levels A1-C1")
-        print()
-        print(f"{Colors.INFO}📊 Enhanced Statistics:{Colors.RESET}")
-        print(f"   • Recently appeared words tracking (last 10)")
-        print(f"   • Recently missed words tracking (last 10)")
-        print(f"   • Complete session summaries (no truncation)")
-        print(f"   • Detailed wrong answer breakdowns")
-        print()
-        print(f"{Colors.INFO}🧠 Learning Algorithm:{Colors.RESET}")
-        print(f"   • Words you get wrong appear more frequently")
-        print(f"   • Mastered words appear less often")
-        print(f"   • Spaced repetition for optimal learning")
-        print(f"   • Persistent word history tracking")
-        print()
-        print(f"{Colors.INFO}⚙️ Advanced Settings:{Colors.RESET}")
-        print(f"   • Factory reset (complete data wipe)")
-        print(f"   • Translation cache management")
-        print(f"   • Statistics export and reset options")
+        print_block(_ABOUT_LINES)
         
         input(f"\n{Colors.INFO}Press Enter to return...{Colors.RESET}")
     
@@ -727,18 +945,7 @@ class OxfordVocabGame:
         clear_screen()
         print_header("🗑️ Factory Reset", 50)
         
-        print_warning("⚠️  DANGER: This will PERMANENTLY DELETE ALL DATA!")
-        print_warning("This includes:")
-        print("   • All high scores and statistics")
-        print("   • All learning progress and word weights")
-        print("   • All translation cache")
-        print("   • All session history")
-        print("   • Recently appeared and missed words")
-        print()
-        print_warning("The application will reset to its initial state.")
-        print_warning("This action CANNOT be undone!")
-        
-        print(f"\n{Colors.BOLD}Are you absolutely sure you want to continue?{Colors.RESET}")
+        print_block(_WIPE_WARNING_LINES)
         confirm1 = input(f"{Colors.ERROR}Type 'DELETE' to continue: {Colors.RESET}").strip()
         
         if confirm1 == 'DELETE':
@@ -750,37 +957,29 @@ class OxfordVocabGame:
                     # Reset word picker stats
                     self.word_picker.reset_all_stats()
                     
-                    # Reset all scores
-                    self.top_scores = {
-                        'overall': 0,
-                        'by_level': {'a1': 0, 'a2': 0, 'b1': 0, 'b2': 0, 'c1': 0, 'c2': 0},
-                        'by_mode': {'custom': 0, 'adventure': 0},
-                        'sessions': []
-                    }
-                    self._save_scores()
-                    
-                    # Reset word history
-                    self.word_history = {
-                        'recent_words': [],
-                        'wrong_words': []
-                    }
-                    self._save_word_history()
+                    # Reset all scores and word history (written once the old files are gone)
+                    self.top_scores = _new_top_scores()
+                    self.session_history.clear()
+                    self.word_history = self._build_word_history()
                     
                     # Clear translation cache
                     self.translator.clear_cache()
+                    self._meaning_index_cache.clear()
                     
-                    # Remove session files
-                    import glob
-                    session_files = glob.glob(os.path.join(self.scores_dir, "*.json"))
-                    for file_path in session_files:
-                        try:
-                            os.remove(file_path)
-                        except:
-                            pass  # Ignore errors for files that don't exist
+                    # Remove session files (other files such as .gitkeep are kept)
+                    with os.scandir(self.scores_dir) as entries:
+                        for entry in entries:
+                            if entry.name.endswith(('.json', '.jsonl')) and entry.is_file():
+                                try:
+                                    os.unlink(entry.path)
+                                except OSError:
+                                    pass  # Ignore errors for files removed in the meantime
                     
-                    # Recreate essential files with default values
+                    # Recreate essential files with default values; word history
+                    # stays in memory until the next word is recorded
+                    self._word_history_loaded_from_disk = False
+                    self._scores_dirty = True
                     self._save_scores()
-                    self._save_word_history()
                     
                     print_success("✅ Factory reset completed successfully!")
                     print_info("All data has been wiped. The application is now in its initial state.")
@@ -1,31 +1,242 @@
 """
 LLM Translator using Groq API for Oxford Vocabulary Trainer
 """
+import atexit
+import hashlib
+import json
 import os
+import sys
+import threading
 import time
-from typing import List, Optional
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 from groq import Groq
 from dotenv import load_dotenv
-from utils import print_error, print_warning, print_info, parse_llm_response
+from .utils import (
+    load_json_file, save_json_file, print_error, print_warning, print_info, parse_llm_response
+)
+
+# Default location of the persistent translation cache
+DEFAULT_CACHE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data', 'cache', 'translations.json'
+)
+
+# Number of new translations to collect before writing the cache file
+CACHE_FLUSH_INTERVAL = 10
+
+# Maximum number of translations kept in the cache
+TRANSLATION_CACHE_SIZE = 2000
+
+# Joins (word, word_class) index keys into the string keys used in the cache file
+CACHE_KEY_SEPARATOR = '|'
+
+TRANSLATOR_SYSTEM_PROMPT = (
+    "You are a professional English-Indonesian translator. "
+    "Provide accurate, contextual translations without explanations."
+)
+
+# Basic fallback dictionary for common words, used when the API is unavailable
+_FALLBACK_TRANSLATIONS = MappingProxyType({
+    # Common verbs
+    'be': ('adalah', 'menjadi', 'berada'),
+    'have': ('mempunyai', 'memiliki', 'punya'),
+    'do': ('melakukan', 'mengerjakan', 'berbuat'),
+    'say': ('berkata', 'mengatakan', 'mengucapkan'),
+    'get': ('mendapat', 'memperoleh', 'mengambil'),
+    'make': ('membuat', 'menciptakan', 'menjadikan'),
+    'go': ('pergi', 'berjalan', 'berangkat'),
+    'know': ('tahu', 'mengetahui', 'kenal'),
+    'take': ('mengambil', 'membawa', 'menerima'),
+    'see': ('melihat', 'memandang', 'menonton'),
+    'come': ('datang', 'tiba', 'hadir'),
+    'think': ('berpikir', 'mengira', 'menganggap'),
+    'look': ('melihat', 'menatap', 'tampak'),
+    'want': ('ingin', 'mau', 'menginginkan'),
+    'give': ('memberi', 'memberikan', 'menyerahkan'),
+    'use': ('menggunakan', 'memakai'),
+    'find': ('menemukan', 'mencari', 'mendapati'),
+    'tell': ('menceritakan', 'memberitahu', 'mengabarkan'),
+    'ask': ('bertanya', 'meminta', 'menanyakan'),
+    'work': ('bekerja', 'kerja', 'pekerjaan', 'tugas'),
+    'feel': ('merasa', 'merasakan', 'perasaan'),
+    'try': ('mencoba', 'berusaha', 'coba'),
+    'leave': ('meninggalkan', 'pergi', 'keluar'),
+    'call': ('memanggil', 'menelepon', 'menyebut'),
+    
+    # Common nouns
+    'time': ('waktu', 'masa', 'kali'),
+    'person': ('orang', 'pribadi', 'individu'),
+    'year': ('tahun', 'tahunan'),
+    'way': ('cara', 'jalan', 'metode'),
+    'day': ('hari', 'siang'),
+    'thing': ('hal', 'benda', 'sesuatu'),
+    'man': ('pria', 'laki-laki', 'orang'),
+    'world': ('dunia', 'bumi'),
+    'life': ('kehidupan', 'hidup', 'nyawa'),
+    'hand': ('tangan', 'kaki tangan'),
+    'part': ('bagian', 'sebagian', 'komponen'),
+    'child': ('anak', 'bocah', 'kecil'),
+    'eye': ('mata', 'pandangan'),
+    'woman': ('wanita', 'perempuan', 'ibu'),
+    'place': ('tempat', 'lokasi', 'wilayah'),
+    'week': ('minggu', 'pekan'),
+    'case': ('kasus', 'hal', 'keadaan'),
+    'point': ('poin', 'titik', 'hal'),
+    'home': ('rumah', 'tempat tinggal', 'kampung halaman'),
+    'water': ('air', 'cairan'),
+    'room': ('ruang', 'kamar', 'tempat'),
+    'mother': ('ibu', 'mama'),
+    'area': ('area', 'daerah', 'wilayah'),
+    'money': ('uang', 'duit', 'modal'),
+    'story': ('cerita', 'kisah', 'dongeng'),
+    'fact': ('fakta', 'kenyataan', 'hal'),
+    'month': ('bulan',),
+    'lot': ('banyak', 'sekali', 'tempat'),
+    'right': ('benar', 'kanan', 'hak'),
+    'study': ('belajar', 'studi', 'penelitian'),
+    'book': ('buku', 'kitab'),
+    'word': ('kata', 'perkataan', 'ucapan'),
+    'business': ('bisnis', 'usaha', 'perdagangan'),
+    'issue': ('masalah', 'isu', 'terbitan'),
+    'side': ('sisi', 'samping', 'pihak'),
+    'kind': ('jenis', 'macam', 'baik hati'),
+    'head': ('kepala', 'ketua', 'pimpinan'),
+    'house': ('rumah', 'gedung'),
+    'service': ('layanan', 'jasa', 'dinas'),
+    'friend': ('teman', 'sahabat', 'kawan'),
+    'father': ('ayah', 'bapak', 'papa'),
+    'power': ('kekuatan', 'tenaga', 'listrik'),
+    'hour': ('jam', 'waktu'),
+    'game': ('permainan', 'pertandingan', 'game'),
+    'line': ('garis', 'baris', 'antrian'),
+    'end': ('akhir', 'ujung', 'tamat'),
+    'member': ('anggota', 'peserta'),
+    'law': ('hukum', 'undang-undang', 'aturan'),
+    'car': ('mobil', 'kereta'),
+    'city': ('kota', 'perkotaan'),
+    'community': ('komunitas', 'masyarakat', 'lingkungan'),
+    'name': ('nama', 'sebutan'),
+    'president': ('presiden', 'ketua'),
+    'team': ('tim', 'kelompok', 'regu'),
+    'minute': ('menit', 'kecil', 'detail'),
+    'idea': ('ide', 'gagasan', 'pikiran'),
+    'kid': ('anak', 'bocah'),
+    'body': ('tubuh', 'badan', 'mayat'),
+    'information': ('informasi', 'keterangan', 'data'),
+    'back': ('punggung', 'belakang', 'kembali'),
+    'parent': ('orang tua', 'induk'),
+    'face': ('wajah', 'muka', 'menghadapi'),
+    'others': ('yang lain', 'orang lain'),
+    'level': ('tingkat', 'level', 'taraf'),
+    'office': ('kantor', 'jabatan'),
+    'door': ('pintu', 'gerbang'),
+    'health': ('kesehatan', 'sehat'),
+    'art': ('seni', 'kesenian'),
+    'war': ('perang', 'peperangan'),
+    'history': ('sejarah', 'riwayat'),
+    'party': ('pesta', 'partai', 'kelompok'),
+    'result': ('hasil', 'akibat', 'kesimpulan'),
+    'change': ('perubahan', 'ganti', 'uang kembalian'),
+    'morning': ('pagi', 'subuh'),
+    'reason': ('alasan', 'sebab'),
+    'research': ('penelitian', 'riset'),
+    'girl': ('gadis', 'perempuan', 'anak perempuan'),
+    'guy': ('lelaki', 'pria', 'orang'),
+    'moment': ('saat', 'momen', 'waktu'),
+    'air': ('udara', 'angin', 'penampilan'),
+    'teacher': ('guru', 'pengajar'),
+    'force': ('kekuatan', 'memaksa', 'pasukan'),
+    'education': ('pendidikan', 'pengajaran'),
+    
+    # Common adjectives
+    'good': ('baik', 'bagus', 'hebat'),
+    'new': ('baru', 'segar'),
+    'first': ('pertama', 'awal'),
+    'last': ('terakhir', 'lalu', 'bertahan'),
+    'long': ('panjang', 'lama'),
+    'great': ('hebat', 'besar', 'bagus'),
+    'little': ('kecil', 'sedikit'),
+    'own': ('sendiri', 'memiliki'),
+    'other': ('lain', 'yang lain'),
+    'old': ('tua', 'lama'),
+    'big': ('besar', 'raya'),
+    'high': ('tinggi', 'naik'),
+    'different': ('berbeda', 'beda'),
+    'small': ('kecil', 'kecil-kecil'),
+    'large': ('besar', 'luas'),
+    'next': ('berikutnya', 'selanjutnya'),
+    'early': ('awal', 'dini', 'cepat'),
+    'young': ('muda', 'remaja'),
+    'important': ('penting', 'utama'),
+    'few': ('sedikit', 'beberapa'),
+    'public': ('umum', 'publik', 'rakyat'),
+    'bad': ('buruk', 'jelek', 'jahat'),
+    'same': ('sama', 'serupa'),
+    'able': ('mampu', 'bisa', 'sanggup'),
+})
+
+class _LRUCache(OrderedDict):
+    """Dict that keeps at most maxsize entries, evicting the least recently used"""
+    
+    def __init__(self, maxsize: int, *args, **kwargs):
+        self.maxsize = maxsize
+        super().__init__(*args, **kwargs)
+    
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
 
 class LLMTranslator:
     """Handle LLM translation using Groq API"""
     
-    def __init__(self):
-        """Initialize the translator with Groq client"""
-        load_dotenv()
+    def __init__(self, cache_file: Optional[str] = None, api_key: Optional[str] = None):
+        """
+        Initialize the translator with Groq client
+        
+        Args:
+            cache_file: Path to the translation cache JSON file (defaults to data/cache/translations.json)
+            api_key: Groq API key; when omitted, .env is loaded and GROQ_API_KEY is read here
+        """
+        if api_key is None:
+            load_dotenv()
+            api_key = os.getenv('GROQ_API_KEY')
         
-        self.api_key = os.getenv('GROQ_API_KEY')
+        self.api_key = api_key
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
         
         self.client = Groq(api_key=self.api_key)
         self.model = "llama-3.1-8b-instant"  # Use the appropriate model for your needs
+        self.temperature = 0.3  # Lower temperature for more consistent results
+        self.max_tokens = 150
         self.max_retries = int(os.getenv('MAX_RETRIES', 3))
         self.timeout = int(os.getenv('TRANSLATION_TIMEOUT', 10))
+        self.batch_workers = int(os.getenv('BATCH_WORKERS', 5))
+        
+        # Minimum spacing between API requests, shared by all threads
+        self.request_interval = float(os.getenv('REQUEST_INTERVAL', 0.5))
+        self._next_request_at = 0.0
+        self._rate_lock = threading.Lock()
         
-        # Cache for translations to avoid repeated API calls
-        self.translation_cache = {}
+        # Cache for translations to avoid repeated API calls, persisted across runs.
+        # Entries are keyed by a hash of the full request (see _cache_key), and
+        # cache_index maps (word, word_class) to the hash last used for that word.
+        self.cache_file = cache_file or DEFAULT_CACHE_FILE
+        translations, index = self._load_cache()
+        self.translation_cache = _LRUCache(TRANSLATION_CACHE_SIZE, translations)
+        self.cache_index = {key: digest for key, digest in index.items() if digest in self.translation_cache}
+        self._unsaved_translations = 0
+        self._cache_lock = threading.RLock()
+        atexit.register(self.save_cache)
         
     def create_translation_prompt(self, word: str, word_class: str) -> str:
         """Create optimized prompt for translation"""
@@ -40,6 +251,34 @@ Word: {word}
 Class: {word_class}
 Indonesian meanings:"""
 
+    def _build_messages(self, prompt: str) -> List[dict]:
+        """Chat messages sent to the API for a translation prompt"""
+        return [
+            {
+                "role": "system",
+                "content": TRANSLATOR_SYSTEM_PROMPT
+            },
+            {
+                "role": "user",
+                "content": prompt
+            }
+        ]
+    
+    def _cache_key(self, messages: List[dict]) -> str:
+        """
+        Hash the request that will be sent with these messages
+        
+        Changing the model, prompts or sampling settings changes the key, so
+        translations cached for an older request are never reused.
+        """
+        request = {
+            'model': self.model,
+            'messages': messages,
+            'temperature': self.temperature,
+            'max_tokens': self.max_tokens
+        }
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode('utf-8')).hexdigest()
+
     def translate_word(self, word: str, word_class: str) -> List[str]:
         """
         Translate word using LLM with caching and error handling
@@ -51,36 +290,34 @@ Indonesian meanings:"""
         Returns:
             List of Indonesian meanings
         """
-        # Create cache key
-        cache_key = f"{word.lower()}_{word_class.lower()}"
+        # Build the request once; the cache key is a hash of exactly what gets sent
+        messages = self._build_messages(self.create_translation_prompt(word, word_class))
+        cache_key = self._cache_key(messages)
+        # Only a handful of word classes, so share their strings
+        word_key = (word.lower(), sys.intern(word_class.lower()))
         
         # Check cache first
-        if cache_key in self.translation_cache:
+        with self._cache_lock:
+            cached = self.translation_cache[cache_key] if cache_key in self.translation_cache else None
+            if cached is not None:
+                self.cache_index[word_key] = cache_key
+        if cached is not None:
             print_info(f"Using cached translation for '{word}'")
-            return self.translation_cache[cache_key]
+            return cached
         
         # Attempt translation with retries
         for attempt in range(self.max_retries):
             try:
                 print_info(f"Translating '{word}' (attempt {attempt + 1}/{self.max_retries})...")
                 
-                prompt = self.create_translation_prompt(word, word_class)
+                self._wait_for_rate_limit()
                 
                 # Make API call with timeout
                 response = self.client.chat.completions.create(
                     model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are a professional English-Indonesian translator. Provide accurate, contextual translations without explanations."
-                        },
-                        {
-                            "role": "user",
-                            "content": prompt
-                        }
-                    ],
-                    max_tokens=150,
-                    temperature=0.3,  # Lower temperature for more consistent results
+                    messages=messages,
+                    max_tokens=self.max_tokens,
+                    temperature=self.temperature,
                     timeout=self.timeout
                 )
                 
@@ -90,9 +327,20 @@ Indonesian meanings:"""
                 # Parse the response
                 meanings = parse_llm_response(translation_text)
                 
+                # Drop meanings that only differ by case, keeping the first spelling
+                unique_meanings = {}
+                for meaning in meanings:
+                    unique_meanings.setdefault(meaning.casefold(), meaning)
+                meanings = list(unique_meanings.values())
+                
                 if meanings:
                     # Cache successful translation
-                    self.translation_cache[cache_key] = meanings
+                    with self._cache_lock:
+                        self.translation_cache[cache_key] = meanings
+                        self.cache_index[word_key] = cache_key
+                        self._unsaved_translations += 1
+                        if self._unsaved_translations >= CACHE_FLUSH_INTERVAL:
+                            self.save_cache()
                     print_info(f"Successfully translated '{word}' with {len(meanings)} meanings")
                     return meanings
                 else:
@@ -112,6 +360,16 @@ Indonesian meanings:"""
         print_error(f"Failed to translate '{word}' after {self.max_retries} attempts")
         return self._get_fallback_translation(word, word_class)
     
+    def _wait_for_rate_limit(self):
+        """Block until this thread may send the next API request"""
+        with self._rate_lock:
+            now = time.monotonic()
+            wait_time = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.request_interval
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
+    
     def _get_fallback_translation(self, word: str, word_class: str) -> List[str]:
         """
         Provide fallback translations for common words
@@ -123,153 +381,10 @@ Indonesian meanings:"""
         Returns:
             List of basic Indonesian meanings
         """
-        # Basic fallback dictionary for common words
-        fallback_dict = {
-            # Common verbs
-            'be': ['adalah', 'menjadi', 'berada'],
-            'have': ['mempunyai', 'memiliki', 'punya'],
-            'do': ['melakukan', 'mengerjakan', 'berbuat'],
-            'say': ['berkata', 'mengatakan', 'mengucapkan'],
-            'get': ['mendapat', 'memperoleh', 'mengambil'],
-            'make': ['membuat', 'menciptakan', 'menjadikan'],
-            'go': ['pergi', 'berjalan', 'berangkat'],
-            'know': ['tahu', 'mengetahui', 'kenal'],
-            'take': ['mengambil', 'membawa', 'menerima'],
-            'see': ['melihat', 'memandang', 'menonton'],
-            'come': ['datang', 'tiba', 'hadir'],
-            'think': ['berpikir', 'mengira', 'menganggap'],
-            'look': ['melihat', 'menatap', 'tampak'],
-            'want': ['ingin', 'mau', 'menginginkan'],
-            'give': ['memberi', 'memberikan', 'menyerahkan'],
-            'use': ['menggunakan', 'memakai', 'menggunakan'],
-            'find': ['menemukan', 'mencari', 'mendapati'],
-            'tell': ['menceritakan', 'memberitahu', 'mengabarkan'],
-            'ask': ['bertanya', 'meminta', 'menanyakan'],
-            'work': ['bekerja', 'kerja', 'pekerjaan'],
-            'feel': ['merasa', 'merasakan', 'perasaan'],
-            'try': ['mencoba', 'berusaha', 'coba'],
-            'leave': ['meninggalkan', 'pergi', 'keluar'],
-            'call': ['memanggil', 'menelepon', 'menyebut'],
-            
-            # Common nouns
-            'time': ['waktu', 'masa', 'kali'],
-            'person': ['orang', 'pribadi', 'individu'],
-            'year': ['tahun', 'tahunan'],
-            'way': ['cara', 'jalan', 'metode'],
-            'day': ['hari', 'siang'],
-            'thing': ['hal', 'benda', 'sesuatu'],
-            'man': ['pria', 'laki-laki', 'orang'],
-            'world': ['dunia', 'bumi'],
-            'life': ['kehidupan', 'hidup', 'nyawa'],
-            'hand': ['tangan', 'kaki tangan'],
-            'part': ['bagian', 'sebagian', 'komponen'],
-            'child': ['anak', 'bocah', 'kecil'],
-            'eye': ['mata', 'pandangan'],
-            'woman': ['wanita', 'perempuan', 'ibu'],
-            'place': ['tempat', 'lokasi', 'wilayah'],
-            'work': ['pekerjaan', 'kerja', 'tugas'],
-            'week': ['minggu', 'pekan'],
-            'case': ['kasus', 'hal', 'keadaan'],
-            'point': ['poin', 'titik', 'hal'],
-            'home': ['rumah', 'tempat tinggal', 'kampung halaman'],
-            'water': ['air', 'cairan'],
-            'room': ['ruang', 'kamar', 'tempat'],
-            'mother': ['ibu', 'mama'],
-            'area': ['area', 'daerah', 'wilayah'],
-            'money': ['uang', 'duit', 'modal'],
-            'story': ['cerita', 'kisah', 'dongeng'],
-            'fact': ['fakta', 'kenyataan', 'hal'],
-            'month': ['bulan'],
-            'lot': ['banyak', 'sekali', 'tempat'],
-            'right': ['benar', 'kanan', 'hak'],
-            'study': ['belajar', 'studi', 'penelitian'],
-            'book': ['buku', 'kitab'],
-            'word': ['kata', 'perkataan', 'ucapan'],
-            'business': ['bisnis', 'usaha', 'perdagangan'],
-            'issue': ['masalah', 'isu', 'terbitan'],
-            'side': ['sisi', 'samping', 'pihak'],
-            'kind': ['jenis', 'macam', 'baik hati'],
-            'head': ['kepala', 'ketua', 'pimpinan'],
-            'house': ['rumah', 'gedung'],
-            'service': ['layanan', 'jasa', 'dinas'],
-            'friend': ['teman', 'sahabat', 'kawan'],
-            'father': ['ayah', 'bapak', 'papa'],
-            'power': ['kekuatan', 'tenaga', 'listrik'],
-            'hour': ['jam', 'waktu'],
-            'game': ['permainan', 'pertandingan', 'game'],
-            'line': ['garis', 'baris', 'antrian'],
-            'end': ['akhir', 'ujung', 'tamat'],
-            'member': ['anggota', 'peserta'],
-            'law': ['hukum', 'undang-undang', 'aturan'],
-            'car': ['mobil', 'kereta'],
-            'city': ['kota', 'perkotaan'],
-            'community': ['komunitas', 'masyarakat', 'lingkungan'],
-            'name': ['nama', 'sebutan'],
-            'president': ['presiden', 'ketua'],
-            'team': ['tim', 'kelompok', 'regu'],
-            'minute': ['menit', 'kecil', 'detail'],
-            'idea': ['ide', 'gagasan', 'pikiran'],
-            'kid': ['anak', 'bocah'],
-            'body': ['tubuh', 'badan', 'mayat'],
-            'information': ['informasi', 'keterangan', 'data'],
-            'back': ['punggung', 'belakang', 'kembali'],
-            'parent': ['orang tua', 'induk'],
-            'face': ['wajah', 'muka', 'menghadapi'],
-            'others': ['yang lain', 'orang lain'],
-            'level': ['tingkat', 'level', 'taraf'],
-            'office': ['kantor', 'jabatan'],
-            'door': ['pintu', 'gerbang'],
-            'health': ['kesehatan', 'sehat'],
-            'person': ['orang', 'pribadi'],
-            'art': ['seni', 'kesenian'],
-            'war': ['perang', 'peperangan'],
-            'history': ['sejarah', 'riwayat'],
-            'party': ['pesta', 'partai', 'kelompok'],
-            'result': ['hasil', 'akibat', 'kesimpulan'],
-            'change': ['perubahan', 'ganti', 'uang kembalian'],
-            'morning': ['pagi', 'subuh'],
-            'reason': ['alasan', 'sebab'],
-            'research': ['penelitian', 'riset'],
-            'girl': ['gadis', 'perempuan', 'anak perempuan'],
-            'guy': ['lelaki', 'pria', 'orang'],
-            'moment': ['saat', 'momen', 'waktu'],
-            'air': ['udara', 'angin', 'penampilan'],
-            'teacher': ['guru', 'pengajar'],
-            'force': ['kekuatan', 'memaksa', 'pasukan'],
-            'education': ['pendidikan', 'pengajaran'],
-            
-            # Common adjectives
-            'good': ['baik', 'bagus', 'hebat'],
-            'new': ['baru', 'segar'],
-            'first': ['pertama', 'awal'],
-            'last': ['terakhir', 'lalu', 'bertahan'],
-            'long': ['panjang', 'lama'],
-            'great': ['hebat', 'besar', 'bagus'],
-            'little': ['kecil', 'sedikit'],
-            'own': ['sendiri', 'memiliki'],
-            'other': ['lain', 'yang lain'],
-            'old': ['tua', 'lama'],
-            'right': ['benar', 'kanan'],
-            'big': ['besar', 'raya'],
-            'high': ['tinggi', 'naik'],
-            'different': ['berbeda', 'beda'],
-            'small': ['kecil', 'kecil-kecil'],
-            'large': ['besar', 'luas'],
-            'next': ['berikutnya', 'selanjutnya'],
-            'early': ['awal', 'dini', 'cepat'],
-            'young': ['muda', 'remaja'],
-            'important': ['penting', 'utama'],
-            'few': ['sedikit', 'beberapa'],
-            'public': ['umum', 'publik', 'rakyat'],
-            'bad': ['buruk', 'jelek', 'jahat'],
-            'same': ['sama', 'serupa'],
-            'able': ['mampu', 'bisa', 'sanggup'],
-        }
-        
-        word_lower = word.lower()
-        if word_lower in fallback_dict:
+        meanings = _FALLBACK_TRANSLATIONS.get(word.lower())
+        if meanings:
             print_warning(f"Using fallback translation for '{word}'")
-            return fallback_dict[word_lower]
+            return list(meanings)
         
         # If no fallback available, return generic response
         print_warning(f"No fallback available for '{word}'")
@@ -290,24 +405,97 @@ Indonesian meanings:"""
         
         print_info(f"Starting batch translation of {total_words} words...")
         
-        for i, (word, word_class) in enumerate(words_data, 1):
-            print_info(f"Progress: {i}/{total_words} - Translating '{word}'")
-            translations[word] = self.translate_word(word, word_class)
-            
-            # Brief pause between requests to avoid rate limiting
-            time.sleep(0.5)
+        # Requests overlap across worker threads; _wait_for_rate_limit keeps them spaced out
+        with ThreadPoolExecutor(max_workers=max(1, self.batch_workers)) as executor:
+            futures = {
+                executor.submit(self.translate_word, word, word_class): word
+                for word, word_class in words_data
+            }
+            for i, future in enumerate(as_completed(futures), 1):
+                word = futures[future]
+                translations[word] = future.result()
+                print_info(f"Progress: {i}/{total_words} - Translated '{word}'")
         
         print_info(f"Batch translation completed! Translated {len(translations)} words.")
         return translations
     
+    def _load_cache(self) -> Tuple[Dict[str, List[str]], Dict[Tuple[str, str], str]]:
+        """
+        Load the cache file
+        
+        Returns:
+            Tuple of (translations by request hash, request hash by (word, word_class))
+        """
+        data = load_json_file(self.cache_file, {})
+        
+        # Files written before request hashing have neither section and are ignored
+        index = {}
+        for key, digest in data.get('index', {}).items():
+            word, separator, word_class = key.partition(CACHE_KEY_SEPARATOR)
+            if separator:
+                index[(word, sys.intern(word_class))] = digest
+        return data.get('translations', {}), index
+    
+    def save_cache(self) -> bool:
+        """Write the translation cache to disk if it has unsaved entries"""
+        with self._cache_lock:
+            if not self._unsaved_translations:
+                return True
+            
+            # Drop index entries whose translation was evicted
+            self.cache_index = {
+                key: digest for key, digest in self.cache_index.items() if digest in self.translation_cache
+            }
+            cache_data = {
+                # A plain dict copy keeps least-recently-used order in the file
+                'translations': dict(self.translation_cache),
+                'index': {
+                    f"{word}{CACHE_KEY_SEPARATOR}{word_class}": digest
+                    for (word, word_class), digest in self.cache_index.items()
+                }
+            }
+            success = save_json_file(self.cache_file, cache_data, compact=True)
+            if success:
+                self._unsaved_translations = 0
+            return success
+    
+    def clear_word(self, word: str, word_class: str) -> bool:
+        """
+        Remove a single word's cached translation
+        
+        Returns:
+            True if a cached translation was removed
+        """
+        word_key = (word.lower(), word_class.lower())
+        with self._cache_lock:
+            digest = self.cache_index.pop(word_key, None)
+            if digest is None or self.translation_cache.pop(digest, None) is None:
+                return False
+            self._unsaved_translations += 1
+        return True
+    
     def clear_cache(self):
         """Clear translation cache"""
-        self.translation_cache.clear()
+        with self._cache_lock:
+            self.translation_cache.clear()
+            self.cache_index.clear()
+            self._unsaved_translations = 0
+        try:
+            os.remove(self.cache_file)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print_error(f"Error removing {self.cache_file}: {e}")
         print_info("Translation cache cleared")
     
     def get_cache_stats(self) -> dict:
         """Get cache statistics"""
-        return {
-            'cache_size': len(self.translation_cache),
-            'cached_words': list(self.translation_cache.keys())
-        }
+        with self._cache_lock:
+            return {
+                'cache_size': len(self.translation_cache),
+                'cached_words': [
+                    f"{word}{CACHE_KEY_SEPARATOR}{word_class}"
+                    for (word, word_class), digest in self.cache_index.items()
+                    if digest in self.translation_cache
+                ]
+            }
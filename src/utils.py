@@ -3,10 +3,19 @@ Utility functions for Oxford Vocabulary Trainer
 """
 import json
 import os
-import pandas as pd
-from typing import Dict, List, Optional, Tuple
+import re
+import sys
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, NamedTuple, Optional, Tuple, Union
 from colorama import Fore, Style, init
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the standard library
+    orjson = None
+
 # Initialize colorama for Windows
 init(autoreset=True)
 
@@ -22,7 +31,14 @@ class Colors:
 
 def clear_screen():
     """Clear the terminal screen"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # Set LEGACY_CLEAR=1 for terminals that don't understand ANSI escapes
+    if os.getenv('LEGACY_CLEAR', '').strip().lower() in ('1', 'true', 'yes'):
+        os.system('cls' if os.name == 'nt' else 'clear')
+        return
+    
+    # Erase the screen and move the cursor home without spawning a shell
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
 def print_header(text: str, width: int = 60):
     """Print a formatted header"""
@@ -46,17 +62,35 @@ def print_info(text: str):
     """Print info message"""
     print(f"{Colors.INFO}ℹ {text}{Colors.RESET}")
 
+def print_block(lines: List[str]):
+    """Print several lines with a single write"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+def _json_dumps(data, compact: bool = False) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS if compact else orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, option=option)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _json_loads(raw: bytes):
+    """Parse JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 def load_json_file(filepath: str, default: dict = None) -> dict:
     """Load JSON file with error handling"""
     if default is None:
         default = {}
     
     try:
-        if os.path.exists(filepath):
-            with open(filepath, 'r', encoding='utf-8') as file:
-                return json.load(file)
-        else:
-            return default.copy()
+        with open(filepath, 'rb') as file:
+            return _json_loads(file.read())
+    except FileNotFoundError:
+        return default.copy()
     except json.JSONDecodeError as e:
         print_error(f"Error loading {filepath}: {e}")
         return default.copy()
@@ -64,38 +98,143 @@ def load_json_file(filepath: str, default: dict = None) -> dict:
         print_error(f"Unexpected error loading {filepath}: {e}")
         return default.copy()
 
-def save_json_file(filepath: str, data: dict) -> bool:
-    """Save dictionary to JSON file with error handling"""
+# Digest of the last payload written to each path by save_json_file
+_saved_digests: Dict[str, int] = {}
+
+def save_json_file(filepath: str, data: dict, skip_unchanged: bool = False, compact: bool = False) -> bool:
+    """
+    Save dictionary to JSON file with error handling
+    
+    Args:
+        filepath: Destination path
+        data: Data to serialize
+        skip_unchanged: Skip the write if this process already wrote identical content
+                        to the file and it still exists
+        compact: Write without indentation or spaces, for files only the game reads
+    """
     try:
+        # Serialize up front so the file is written in a single call
+        payload = _json_dumps(data, compact)
+        digest = hash(payload)
+        if skip_unchanged and _saved_digests.get(filepath) == digest and os.path.exists(filepath):
+            return True
+        
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         
-        with open(filepath, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
+        # Write to a temporary file and swap it in so readers never see a partial file
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_path, filepath)
+        _saved_digests[filepath] = digest
+        return True
+    except Exception as e:
+        print_error(f"Error saving to {filepath}: {e}")
+        return False
+
+def _read_tail_lines(file, limit: int, block_size: int = 8192) -> List[bytes]:
+    """Read the last `limit` lines of a binary file by reading blocks back from the end"""
+    file.seek(0, os.SEEK_END)
+    position = file.tell()
+    data = b''
+    
+    # A partial first line is dropped below, so collect one newline more than needed
+    while position > 0 and data.count(b'\n') <= limit:
+        step = min(block_size, position)
+        position -= step
+        file.seek(position)
+        data = file.read(step) + data
+    
+    lines = data.splitlines()
+    if position > 0:
+        lines = lines[1:]
+    return lines[-limit:]
+
+def load_jsonl_file(filepath: str, limit: Optional[int] = None) -> List:
+    """
+    Load records from a JSON Lines file with error handling
+    
+    Args:
+        filepath: Source path
+        limit: Only read and parse the last `limit` lines
+    """
+    if limit is not None and limit <= 0:
+        return []
+    
+    try:
+        with open(filepath, 'rb') as file:
+            lines = file.read().splitlines() if limit is None else _read_tail_lines(file, limit)
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print_error(f"Unexpected error loading {filepath}: {e}")
+        return []
+    
+    records = []
+    for line in lines:
+        if not line.strip():
+            continue
+        try:
+            records.append(_json_loads(line))
+        except json.JSONDecodeError as e:
+            # Skip a line left half-written by an interrupted append
+            print_error(f"Skipping bad line in {filepath}: {e}")
+    return records
+
+def save_jsonl_file(filepath: str, records: List) -> bool:
+    """Replace a JSON Lines file with the given records, one compact JSON object per line"""
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        payload = b''.join(_json_dumps(record, compact=True) + b'\n' for record in records)
+        
+        # Write to a temporary file and swap it in so readers never see a partial file
+        tmp_path = f"{filepath}.tmp"
+        with open(tmp_path, 'wb') as file:
+            file.write(payload)
+        os.replace(tmp_path, filepath)
         return True
     except Exception as e:
         print_error(f"Error saving to {filepath}: {e}")
         return False
 
-def load_oxford_data(filepath: str) -> pd.DataFrame:
+def append_jsonl_file(filepath: str, records: List) -> bool:
+    """Append records to a JSON Lines file, one compact JSON object per line"""
+    try:
+        os.makedirs(os.path.dirname(filepath), exist_ok=True)
+        payload = b''.join(_json_dumps(record, compact=True) + b'\n' for record in records)
+        with open(filepath, 'ab') as file:
+            file.write(payload)
+        return True
+    except Exception as e:
+        print_error(f"Error appending to {filepath}: {e}")
+        return False
+
+def load_oxford_data(filepath: str) -> 'pd.DataFrame':
     """Load Oxford CSV data with validation"""
+    # pandas is imported lazily so setup/error paths don't pay for it
+    import pandas as pd
+    
     try:
-        df = pd.read_csv(filepath)
+        # Only parse the columns the game uses
+        required_columns = ['word', 'class', 'level']
+        df = pd.read_csv(filepath, usecols=lambda column: column in required_columns)
         
         # Validate required columns
-        required_columns = ['word', 'class', 'level']
         if not all(col in df.columns for col in required_columns):
             raise ValueError(f"CSV must contain columns: {required_columns}")
         
         # Clean and validate data
         df = df.dropna()
-        df['word'] = df['word'].str.strip().str.lower()
-        df['class'] = df['class'].str.strip().str.lower()
-        df['level'] = df['level'].str.strip().str.lower()
+        df = df.assign(**{col: df[col].str.strip().str.lower() for col in required_columns})
         
-        # Filter valid levels
+        # Filter valid levels; anything outside the categories becomes NaN and is dropped
         valid_levels = ['a1', 'a2', 'b1', 'b2', 'c1', 'c2']
-        df = df[df['level'].isin(valid_levels)]
+        df['level'] = pd.Categorical(df['level'], categories=valid_levels)
+        df = df.dropna(subset=['level'])
+        
+        # Few distinct word classes, so store them as categories too
+        df['class'] = df['class'].astype('category')
         
         print_success(f"Loaded {len(df)} words from {os.path.basename(filepath)}")
         return df
@@ -107,108 +246,122 @@ def load_oxford_data(filepath: str) -> pd.DataFrame:
         print_error(f"Error loading data: {e}")
         return pd.DataFrame()
 
-def validate_user_input(user_input: str, valid_meanings: List[str]) -> bool:
-    """Validate user input against possible meanings"""
+class MeaningIndex(NamedTuple):
+    """Normalized lookup sets for checking answers against a word's meanings"""
+    exact: FrozenSet[str]                 # Whole meanings
+    words: FrozenSet[str]                 # Every complete word of every meaning
+    phrases: Tuple[FrozenSet[str], ...]   # Complete words of each meaning, per meaning
+
+def precompute_meaning_index(meanings: List[str]) -> MeaningIndex:
+    """Build the answer lookup sets for a list of meanings once"""
+    cleaned = [meaning.strip().casefold() for meaning in meanings]
+    phrases = tuple(frozenset(meaning.split()) for meaning in cleaned)
+    return MeaningIndex(
+        exact=frozenset(cleaned),
+        words=frozenset().union(*phrases),
+        phrases=phrases
+    )
+
+def validate_user_input(user_input: str, valid_meanings: Union[List[str], MeaningIndex]) -> bool:
+    """Validate user input against possible meanings or a precomputed MeaningIndex"""
     if not user_input or not valid_meanings:
         return False
     
+    if not isinstance(valid_meanings, MeaningIndex):
+        valid_meanings = precompute_meaning_index(valid_meanings)
+    
     # Clean user input
-    user_input = user_input.strip().lower()
+    user_input = user_input.strip().casefold()
     
-    # Check exact matches and word-boundary matches
-    for meaning in valid_meanings:
-        meaning_clean = meaning.strip().lower()
-        
-        # Exact match
-        if user_input == meaning_clean:
-            return True
-        
-        # Check if user input matches any complete word in the meaning
-        # Split both user input and meaning into words
-        user_words = user_input.split()
-        meaning_words = meaning_clean.split()
-        
-        # Check if all user words are present as complete words in meaning
-        if len(user_words) == 1 and len(user_words[0]) >= 3:
-            # Single word input - check if it matches any complete word in meanings
-            for meaning_word in meaning_words:
-                if user_words[0] == meaning_word:
-                    return True
-        elif len(user_words) > 1:
-            # Multi-word input - check if all words are present
-            user_words_set = set(user_words)
-            meaning_words_set = set(meaning_words)
-            if user_words_set.issubset(meaning_words_set):
-                return True
+    # Exact match
+    if user_input in valid_meanings.exact:
+        return True
+    
+    user_words = user_input.split()
+    if len(user_words) == 1:
+        # Single word input - check if it matches any complete word in meanings
+        return len(user_input) >= 3 and user_input in valid_meanings.words
+    if len(user_words) > 1:
+        # Multi-word input - all words must appear in the same meaning
+        user_words_set = set(user_words)
+        return any(user_words_set <= phrase for phrase in valid_meanings.phrases)
     
     return False
 
+# CEFR level colors and descriptions used by the display helpers
+_LEVEL_COLORS = {
+    'a1': Fore.GREEN,
+    'a2': Fore.LIGHTGREEN_EX,
+    'b1': Fore.YELLOW,
+    'b2': Fore.LIGHTYELLOW_EX,
+    'c1': Fore.RED,
+    'c2': Fore.LIGHTRED_EX
+}
+
+_LEVEL_DESCRIPTIONS = {
+    'a1': 'Beginner - Basic everyday expressions',
+    'a2': 'Elementary - Simple phrases and frequently used expressions',
+    'b1': 'Intermediate - Clear standard input on familiar matters',
+    'b2': 'Upper-Intermediate - Complex text on concrete and abstract topics',
+    'c1': 'Advanced - Wide range of demanding texts',
+    'c2': 'Proficient - Virtually everything heard or read'
+}
+
+_WORD_DISPLAY_TEMPLATE = f"""
+{Colors.HEADER}Word:{Colors.RESET} {Colors.BOLD}{{word}}{Colors.RESET}
+{Colors.INFO}Class:{Colors.RESET} {{word_class}}
+{Colors.INFO}Level:{Colors.RESET} {{level_color}}{{level}}{Colors.RESET}
+"""
+
 def format_word_display(word: str, word_class: str, level: str) -> str:
     """Format word display for gameplay"""
-    level_colors = {
-        'a1': Fore.GREEN,
-        'a2': Fore.LIGHTGREEN_EX,
-        'b1': Fore.YELLOW,
-        'b2': Fore.LIGHTYELLOW_EX,
-        'c1': Fore.RED,
-        'c2': Fore.LIGHTRED_EX
-    }
-    
-    level_color = level_colors.get(level.lower(), Fore.WHITE)
-    
-    return f"""
-{Colors.HEADER}Word:{Colors.RESET} {Colors.BOLD}{word.title()}{Colors.RESET}
-{Colors.INFO}Class:{Colors.RESET} {word_class.title()}
-{Colors.INFO}Level:{Colors.RESET} {level_color}{level.upper()}{Colors.RESET}
-"""
+    return _WORD_DISPLAY_TEMPLATE.format(
+        word=word.title(),
+        word_class=word_class.title(),
+        level_color=_LEVEL_COLORS.get(level.lower(), Fore.WHITE),
+        level=level.upper()
+    )
 
 def get_level_description(level: str) -> str:
     """Get CEFR level description"""
-    descriptions = {
-        'a1': 'Beginner - Basic everyday expressions',
-        'a2': 'Elementary - Simple phrases and frequently used expressions',
-        'b1': 'Intermediate - Clear standard input on familiar matters',
-        'b2': 'Upper-Intermediate - Complex text on concrete and abstract topics',
-        'c1': 'Advanced - Wide range of demanding texts',
-        'c2': 'Proficient - Virtually everything heard or read'
-    }
-    return descriptions.get(level.lower(), 'Unknown level')
+    return _LEVEL_DESCRIPTIONS.get(level.lower(), 'Unknown level')
 
 def display_game_stats(current_score: int, top_score: int, level: str):
     """Display current game statistics"""
-    print(f"\n{Colors.INFO}📊 Game Stats:{Colors.RESET}")
-    print(f"   Current Score: {Colors.BOLD}{current_score}{Colors.RESET}")
-    print(f"   Top Score: {Colors.SUCCESS}{top_score}{Colors.RESET}")
-    print(f"   Level: {Colors.WARNING}{level.upper()}{Colors.RESET}")
-    print("-" * 30)
+    reset = Colors.RESET
+    print_block([
+        f"\n{Colors.INFO}📊 Game Stats:{reset}",
+        f"   Current Score: {Colors.BOLD}{current_score}{reset}",
+        f"   Top Score: {Colors.SUCCESS}{top_score}{reset}",
+        f"   Level: {Colors.WARNING}{level.upper()}{reset}",
+        "-" * 30
+    ])
+
+# Bullet and list-numbering prefixes found in LLM translation responses
+_BULLET_PREFIX_CHARS = '*• \t\r\f\v'
+_NUMBER_PREFIX_RE = re.compile(r'^(?:\d+\.[*•\s]*)+')
 
 def parse_llm_response(response: str) -> List[str]:
     """Parse LLM response to extract Indonesian meanings"""
     if not response:
         return []
     
-    # Split by common separators and clean
-    separators = [',', ';', '\n', '|', '-']
-    meanings = [response]
-    
-    for sep in separators:
-        new_meanings = []
-        for meaning in meanings:
-            new_meanings.extend(meaning.split(sep))
-        meanings = new_meanings
+    # Split by common separators (',', ';', newline, '|', '-') and clean
+    meanings = response.replace(';', ',').replace('\n', ',').replace('|', ',').replace('-', ',').split(',')
     
     # Clean and filter meanings
     cleaned_meanings = []
     for meaning in meanings:
-        cleaned = meaning.strip()
-        # Remove common prefixes/artifacts
-        prefixes_to_remove = ['*', '-', '•', '1.', '2.', '3.', '4.', '5.']
-        for prefix in prefixes_to_remove:
-            if cleaned.startswith(prefix):
-                cleaned = cleaned[len(prefix):].strip()
+        # Remove common prefixes/artifacts (bullets, then list numbering if any)
+        cleaned = meaning.lstrip(_BULLET_PREFIX_CHARS)
+        if cleaned[:1].isdigit():
+            cleaned = _NUMBER_PREFIX_RE.sub('', cleaned)
+        cleaned = cleaned.strip()
         
         # Filter out empty strings and very short words
-        if cleaned and len(cleaned) >= 2:
+        if len(cleaned) >= 2:
             cleaned_meanings.append(cleaned)
+            if len(cleaned_meanings) == 10:  # Limit to 10 meanings max
+                break
     
-    return cleaned_meanings[:10]  # Limit to 10 meanings max
+    return cleaned_meanings
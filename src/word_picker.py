@@ -1,10 +1,110 @@
 """
 Word picker with adaptive weighting system for Oxford Vocabulary Trainer
 """
+import atexit
+import heapq
 import random
+from datetime import datetime
+from types import MappingProxyType
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Tuple, Optional
-from utils import load_json_file, save_json_file, print_info, print_error
+from typing import Iterable, List, Dict, Tuple, Optional
+from .utils import load_json_file, save_json_file, print_info, print_error
+
+try:
+    from numba import njit
+except ImportError:  # Optional speedup, fall back to the NumPy implementation
+    njit = None
+
+# Number of word updates to collect before writing the weights file
+WEIGHTS_SAVE_INTERVAL = 10
+
+# Row positions returned for a level with no words
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+# Statistics a word starts with before its first attempt; read-only, copy before use
+_DEFAULT_STATS = MappingProxyType({
+    'weight': 1.0,  # Default weight
+    'correct_count': 0,
+    'wrong_count': 0,
+    'total_attempts': 0,
+    'last_seen': None,
+    'consecutive_correct': 0,
+    'consecutive_wrong': 0
+})
+
+def _adaptive_weight(correct_count: int, total_attempts: int,
+                     consecutive_correct: int, consecutive_wrong: int) -> float:
+    """Calculate the adaptive weight for one word's performance statistics"""
+    if total_attempts == 0:
+        return 1.0
+    
+    # Calculate accuracy
+    accuracy = correct_count / total_attempts
+    
+    # Base weight calculation
+    if accuracy >= 0.8:  # High accuracy (80%+)
+        base_weight = 0.3  # Lower weight (appears less often)
+    elif accuracy >= 0.6:  # Moderate accuracy (60-79%)
+        base_weight = 0.7
+    elif accuracy >= 0.4:  # Low accuracy (40-59%)
+        base_weight = 1.2
+    else:  # Very low accuracy (<40%)
+        base_weight = 2.0  # Higher weight (appears more often)
+    
+    # Consecutive performance modifiers
+    if consecutive_correct >= 3:
+        # Reduce weight significantly for consistently correct answers
+        consecutive_modifier = 0.5
+    elif consecutive_wrong >= 2:
+        # Increase weight significantly for consecutive wrong answers
+        consecutive_modifier = 2.5
+    else:
+        consecutive_modifier = 1.0
+    
+    # Attempt-based modifier (newer words get slight boost)
+    if total_attempts <= 3:
+        attempt_modifier = 1.2  # Slight boost for new words
+    elif total_attempts >= 10:
+        attempt_modifier = 0.9  # Slight reduction for well-practiced words
+    else:
+        attempt_modifier = 1.0
+    
+    # Ensure weight stays within reasonable bounds
+    return max(0.1, min(5.0, base_weight * consecutive_modifier * attempt_modifier))
+
+def _adaptive_weights(correct: np.ndarray, attempts: np.ndarray,
+                      consecutive_correct: np.ndarray, consecutive_wrong: np.ndarray) -> np.ndarray:
+    """Calculate adaptive weights for arrays of performance statistics (batch form of _adaptive_weight)"""
+    # Calculate accuracy
+    accuracy = correct / np.maximum(attempts, 1)
+    
+    # Base weight: high accuracy (80%+) appears less often, very low (<40%) more often
+    base_weight = np.select([accuracy >= 0.8, accuracy >= 0.6, accuracy >= 0.4], [0.3, 0.7, 1.2], default=2.0)
+    
+    # Consecutive performance modifiers
+    consecutive_modifier = np.where(consecutive_correct >= 3, 0.5, np.where(consecutive_wrong >= 2, 2.5, 1.0))
+    
+    # Attempt-based modifier (newer words get slight boost, well-practiced words a slight reduction)
+    attempt_modifier = np.where(attempts <= 3, 1.2, np.where(attempts >= 10, 0.9, 1.0))
+    
+    # Ensure weight stays within reasonable bounds; unseen words keep the default weight
+    final_weight = np.clip(base_weight * consecutive_modifier * attempt_modifier, 0.1, 5.0)
+    return np.where(attempts == 0, 1.0, final_weight)
+
+if njit is not None:
+    _compiled_adaptive_weight = njit(cache=True)(_adaptive_weight)
+    
+    @njit(cache=True)
+    def _recalculate_weights(correct, attempts, consecutive_correct, consecutive_wrong):
+        """Batch weight recalculation as a compiled loop over _adaptive_weight"""
+        weights = np.empty(len(attempts))
+        for i in range(len(attempts)):
+            weights[i] = _compiled_adaptive_weight(correct[i], attempts[i], consecutive_correct[i], consecutive_wrong[i])
+        return weights
+else:
+    # Without numba, batch recalculation uses the NumPy formula
+    _recalculate_weights = _adaptive_weights
 
 class WordPicker:
     """Handle word selection with adaptive weighting"""
@@ -17,13 +117,92 @@ class WordPicker:
             data_df: DataFrame containing word data
             weights_file: Path to weights JSON file
         """
-        self.data_df = data_df
+        # Few distinct classes and levels, so store them as categories (a no-op for
+        # frames from load_oxford_data); grouping then works on integer codes
+        self.data_df = data_df = data_df.astype({'class': 'category', 'level': 'category'})
         self.weights_file = weights_file
-        self.word_weights = self._load_weights()
+        
+        # Build every word key in one vectorized pass; reused by the other lookups
+        self._all_keys = data_df['word'].astype(str).str.cat(
+            [data_df['class'].astype(str), data_df['level'].astype(str)], sep='_'
+        ).to_numpy()
+        # Plain list of the keys, converted once for the dict building in saves and exports
+        self._key_list = self._all_keys.tolist()
+        self._key_to_idx = dict(zip(self._key_list, range(len(self._key_list))))
+        
+        # Column arrays and row positions per level, so picks don't touch the DataFrame
+        self._words_arr = data_df['word'].to_numpy()
+        self._classes_arr = data_df['class'].to_numpy()
+        self._levels_arr = data_df['level'].to_numpy()
+        self._level_index = data_df.groupby('level', observed=True).indices
+        self._all_index = np.arange(len(self._all_keys))
+        
+        # Per-word statistics as parallel arrays indexed by row position
+        size = len(self._all_keys)
+        self._weights_vec = np.full(size, _DEFAULT_STATS['weight'])
+        self._correct = np.zeros(size, dtype=np.int32)
+        self._wrong = np.zeros(size, dtype=np.int32)
+        self._attempts = np.zeros(size, dtype=np.int32)
+        self._last_seen = np.full(size, None, dtype=object)
+        self._consec_correct = np.zeros(size, dtype=np.int16)
+        self._consec_wrong = np.zeros(size, dtype=np.int16)
+        
+        # Saved words that are no longer in the vocabulary, kept so saving doesn't drop them
+        self._extra_stats: Dict[str, Dict] = {}
+        
+        # Cumulative weights per level (None for all levels), rebuilt on the next pick after a weight changes
+        self._cum_weights: Dict[Optional[str], np.ndarray] = {}
+        
+        # Updates not yet written to the weights file
+        self._unsaved_updates = 0
         
         # Initialize weights for new words
-        self._initialize_new_words()
+        self._initialize_new_words(self._load_weights())
+        atexit.register(self.flush)
+    
+    def _stat_columns(self) -> Tuple[np.ndarray, ...]:
+        """Statistic arrays in the same field order as _DEFAULT_STATS"""
+        return (self._weights_vec, self._correct, self._wrong, self._attempts,
+                self._last_seen, self._consec_correct, self._consec_wrong)
+    
+    @property
+    def word_weights(self) -> Dict[str, Dict]:
+        """Statistics of every word as a dict keyed by word key"""
+        columns = [column.tolist() for column in self._stat_columns()]
+        weights = {key: dict(zip(_DEFAULT_STATS, values))
+                   for key, values in zip(self._key_list, zip(*columns))}
+        weights.update(self._extra_stats)
+        return weights
+    
+    def _get_stats(self, word_key: str) -> Optional[Dict]:
+        """Get a copy of a word's statistics"""
+        idx = self._key_to_idx.get(word_key)
+        if idx is None:
+            stats = self._extra_stats.get(word_key)
+            return None if stats is None else stats.copy()
         
+        return {
+            'weight': float(self._weights_vec[idx]),
+            'correct_count': int(self._correct[idx]),
+            'wrong_count': int(self._wrong[idx]),
+            'total_attempts': int(self._attempts[idx]),
+            'last_seen': self._last_seen[idx],
+            'consecutive_correct': int(self._consec_correct[idx]),
+            'consecutive_wrong': int(self._consec_wrong[idx])
+        }
+    
+    def _set_stats(self, word_key: str, stats: Dict):
+        """Store a word's statistics"""
+        idx = self._key_to_idx.get(word_key)
+        if idx is None:
+            self._extra_stats[word_key] = stats
+            return
+        
+        for column, field in zip(self._stat_columns(), _DEFAULT_STATS):
+            column[idx] = stats[field]
+        self._cum_weights.pop(self._levels_arr[idx], None)
+        self._cum_weights.pop(None, None)
+    
     def _load_weights(self) -> Dict[str, Dict]:
         """Load word weights from file"""
         default_weights = {}
@@ -33,29 +212,43 @@ class WordPicker:
     
     def _save_weights(self) -> bool:
         """Save current weights to file"""
-        success = save_json_file(self.weights_file, self.word_weights)
+        word_weights = self.word_weights
+        success = save_json_file(self.weights_file, word_weights, compact=True)
         if success:
-            print_info(f"Saved weights for {len(self.word_weights)} words")
+            self._unsaved_updates = 0
+            print_info(f"Saved weights for {len(word_weights)} words")
         return success
     
-    def _initialize_new_words(self):
-        """Initialize weights for words not in weights file"""
-        new_words_count = 0
-        
-        for _, row in self.data_df.iterrows():
-            word_key = f"{row['word']}_{row['class']}_{row['level']}"
-            
-            if word_key not in self.word_weights:
-                self.word_weights[word_key] = {
-                    'weight': 1.0,  # Default weight
-                    'correct_count': 0,
-                    'wrong_count': 0,
-                    'total_attempts': 0,
-                    'last_seen': None,
-                    'consecutive_correct': 0,
-                    'consecutive_wrong': 0
-                }
-                new_words_count += 1
+    def _mark_updated(self, count: int = 1):
+        """Count unsaved updates and write the weights file every WEIGHTS_SAVE_INTERVAL updates"""
+        self._unsaved_updates += count
+        if self._unsaved_updates >= WEIGHTS_SAVE_INTERVAL:
+            self._save_weights()
+    
+    def flush(self) -> bool:
+        """Write the weights file if it has unsaved updates"""
+        if not self._unsaved_updates:
+            return True
+        return self._save_weights()
+    
+    def _initialize_new_words(self, saved_weights: Dict[str, Dict]):
+        """Fill the statistic arrays from saved weights and initialize words not in the file"""
+        key_to_idx = self._key_to_idx
+        positions = []
+        saved_stats = []
+        for key, stats in saved_weights.items():
+            idx = key_to_idx.get(key)
+            if idx is None:
+                self._extra_stats[key] = stats
+            else:
+                positions.append(idx)
+                saved_stats.append(stats)
+        
+        # One vectorized assignment per field; missing fields keep their defaults
+        for column, (field, default) in zip(self._stat_columns(), _DEFAULT_STATS.items()):
+            column[positions] = [stats.get(field, default) for stats in saved_stats]
+        
+        new_words_count = len(self._all_keys) - len(positions)
         
         if new_words_count > 0:
             print_info(f"Initialized weights for {new_words_count} new words")
@@ -71,38 +264,29 @@ class WordPicker:
         Returns:
             Tuple of (word, class, level) or None if no words available
         """
-        # Filter data by level if specified
-        if level:
-            filtered_df = self.data_df[self.data_df['level'] == level.lower()]
-        else:
-            filtered_df = self.data_df
+        # Filter rows by level if specified
+        level_key = level.lower() if level else None
+        idx = self._level_rows(level)
         
-        if filtered_df.empty:
+        if len(idx) == 0:
             print_error(f"No words available for level: {level}")
             return None
         
-        # Prepare weighted selection
-        words_data = []
-        weights = []
-        
-        for _, row in filtered_df.iterrows():
-            word_key = f"{row['word']}_{row['class']}_{row['level']}"
-            word_weight = self.word_weights.get(word_key, {}).get('weight', 1.0)
-            
-            words_data.append((row['word'], row['class'], row['level']))
-            weights.append(word_weight)
-        
-        if not words_data:
-            return None
+        # Weighted random selection: bisect the level's cached cumulative weights
+        cum_weights = self._cum_weights.get(level_key)
+        if cum_weights is None:
+            cum_weights = self._cum_weights[level_key] = self._weights_vec[idx].cumsum()
         
-        # Weighted random selection
-        try:
-            selected_word = random.choices(words_data, weights=weights, k=1)[0]
-            return selected_word
-        except Exception as e:
-            print_error(f"Error in weighted selection: {e}")
+        total = cum_weights[-1]
+        if total > 0:
+            pos = min(int(np.searchsorted(cum_weights, random.random() * total, side='right')), len(idx) - 1)
+        else:
+            print_error("Error in weighted selection: total of weights must be greater than zero")
             # Fallback to simple random selection
-            return random.choice(words_data)
+            pos = random.randrange(len(idx))
+        
+        row = idx[pos]
+        return (self._words_arr[row], self._classes_arr[row], self._levels_arr[row])
     
     def update_word_performance(self, word: str, word_class: str, level: str, is_correct: bool):
         """
@@ -117,22 +301,13 @@ class WordPicker:
         word_key = f"{word}_{word_class}_{level}"
         
         # Initialize if not exists
-        if word_key not in self.word_weights:
-            self.word_weights[word_key] = {
-                'weight': 1.0,
-                'correct_count': 0,
-                'wrong_count': 0,
-                'total_attempts': 0,
-                'last_seen': None,
-                'consecutive_correct': 0,
-                'consecutive_wrong': 0
-            }
-        
-        word_stats = self.word_weights[word_key]
+        word_stats = self._get_stats(word_key)
+        if word_stats is None:
+            word_stats = _DEFAULT_STATS.copy()
         
         # Update basic stats
         word_stats['total_attempts'] += 1
-        word_stats['last_seen'] = pd.Timestamp.now().isoformat()
+        word_stats['last_seen'] = datetime.now().isoformat(timespec='seconds')
         
         if is_correct:
             word_stats['correct_count'] += 1
@@ -146,14 +321,69 @@ class WordPicker:
         # Calculate new weight using adaptive algorithm
         new_weight = self._calculate_adaptive_weight(word_stats)
         word_stats['weight'] = new_weight
+        self._set_stats(word_key, word_stats)
         
-        # Save updated weights
-        self._save_weights()
+        # Save updated weights (batched, see flush)
+        self._mark_updated()
         
         # Log performance update
         accuracy = word_stats['correct_count'] / word_stats['total_attempts'] * 100
         print_info(f"Updated '{word}': accuracy={accuracy:.1f}%, weight={new_weight:.2f}")
     
+    def apply_results(self, results: Iterable[Tuple[str, str, str, bool]]) -> int:
+        """
+        Apply answers to the word statistics, recalculating the touched weights once
+        
+        Args:
+            results: (word, class, level, is_correct) tuples in the order they were answered
+            
+        Returns:
+            Number of results applied
+        """
+        now = datetime.now().isoformat(timespec='seconds')
+        touched = []
+        applied = 0
+        
+        for word, word_class, level, is_correct in results:
+            applied += 1
+            idx = self._key_to_idx.get(f"{word}_{word_class}_{level}")
+            if idx is None:
+                # Words outside the vocabulary go through the per-word path
+                self.update_word_performance(word, word_class, level, is_correct)
+                continue
+            
+            self._attempts[idx] += 1
+            self._last_seen[idx] = now
+            if is_correct:
+                self._correct[idx] += 1
+                self._consec_correct[idx] += 1
+                self._consec_wrong[idx] = 0
+            else:
+                self._wrong[idx] += 1
+                self._consec_wrong[idx] += 1
+                self._consec_correct[idx] = 0
+            touched.append(idx)
+        
+        if touched:
+            idx = np.unique(touched)
+            self._weights_vec[idx] = _recalculate_weights(
+                self._correct[idx], self._attempts[idx], self._consec_correct[idx], self._consec_wrong[idx]
+            )
+            for level in set(self._levels_arr[idx].tolist()):
+                self._cum_weights.pop(level, None)
+            self._cum_weights.pop(None, None)
+            self._mark_updated(len(touched))
+            
+            # Log performance update (per word for a single answer, summarized for replays)
+            if len(idx) == 1:
+                i = idx[0]
+                accuracy = self._correct[i] / self._attempts[i] * 100
+                print_info(f"Updated '{self._words_arr[i]}': accuracy={accuracy:.1f}%, weight={self._weights_vec[i]:.2f}")
+            else:
+                print_info(f"Applied {len(touched)} results to {len(idx)} words")
+        
+        return applied
+    
     def _calculate_adaptive_weight(self, stats: Dict) -> float:
         """
         Calculate adaptive weight based on performance statistics
@@ -164,65 +394,22 @@ class WordPicker:
         Returns:
             New weight value
         """
-        total_attempts = stats['total_attempts']
-        correct_count = stats['correct_count']
-        consecutive_correct = stats['consecutive_correct']
-        consecutive_wrong = stats['consecutive_wrong']
-        
-        if total_attempts == 0:
-            return 1.0
-        
-        # Calculate accuracy
-        accuracy = correct_count / total_attempts
-        
-        # Base weight calculation
-        if accuracy >= 0.8:  # High accuracy (80%+)
-            base_weight = 0.3  # Lower weight (appears less often)
-        elif accuracy >= 0.6:  # Moderate accuracy (60-79%)
-            base_weight = 0.7
-        elif accuracy >= 0.4:  # Low accuracy (40-59%)
-            base_weight = 1.2
-        else:  # Very low accuracy (<40%)
-            base_weight = 2.0  # Higher weight (appears more often)
-        
-        # Consecutive performance modifiers
-        if consecutive_correct >= 3:
-            # Reduce weight significantly for consistently correct answers
-            consecutive_modifier = 0.5
-        elif consecutive_wrong >= 2:
-            # Increase weight significantly for consecutive wrong answers
-            consecutive_modifier = 2.5
-        else:
-            consecutive_modifier = 1.0
-        
-        # Attempt-based modifier (newer words get slight boost)
-        if total_attempts <= 3:
-            attempt_modifier = 1.2  # Slight boost for new words
-        elif total_attempts >= 10:
-            attempt_modifier = 0.9  # Slight reduction for well-practiced words
-        else:
-            attempt_modifier = 1.0
-        
-        # Calculate final weight
-        final_weight = base_weight * consecutive_modifier * attempt_modifier
-        
-        # Ensure weight stays within reasonable bounds
-        return max(0.1, min(5.0, final_weight))
+        return _adaptive_weight(
+            stats['correct_count'], stats['total_attempts'],
+            stats['consecutive_correct'], stats['consecutive_wrong']
+        )
     
     def get_word_statistics(self, word: str, word_class: str, level: str) -> Optional[Dict]:
         """Get statistics for a specific word"""
         word_key = f"{word}_{word_class}_{level}"
-        return self.word_weights.get(word_key)
+        return self._get_stats(word_key)
     
     def get_level_statistics(self, level: str) -> Dict:
         """Get aggregated statistics for a level"""
-        level_words = []
-        
-        for word_key, stats in self.word_weights.items():
-            if word_key.endswith(f"_{level}"):
-                level_words.append(stats)
+        # Only visit the level's own rows
+        idx = self._level_index.get(level.lower())
         
-        if not level_words:
+        if idx is None or not len(idx):
             return {
                 'total_words': 0,
                 'total_attempts': 0,
@@ -231,17 +418,17 @@ class WordPicker:
                 'mastery_level': 0.0
             }
         
-        total_words = len(level_words)
-        total_attempts = sum(w['total_attempts'] for w in level_words)
-        total_correct = sum(w['correct_count'] for w in level_words)
+        total_words = len(idx)
+        attempts = self._attempts[idx]
+        correct = self._correct[idx]
+        total_attempts = int(attempts.sum())
+        total_correct = int(correct.sum())
         
         average_accuracy = (total_correct / total_attempts * 100) if total_attempts > 0 else 0
         
         # Calculate mastery level (percentage of words with >80% accuracy)
-        mastered_words = sum(1 for w in level_words 
-                           if w['total_attempts'] >= 3 and 
-                           w['correct_count'] / w['total_attempts'] >= 0.8)
-        mastery_level = (mastered_words / total_words * 100) if total_words > 0 else 0
+        mastered_words = int(((attempts >= 3) & (correct / np.maximum(attempts, 1) >= 0.8)).sum())
+        mastery_level = mastered_words / total_words * 100
         
         return {
             'total_words': total_words,
@@ -251,6 +438,18 @@ class WordPicker:
             'mastery_level': mastery_level
         }
     
+    def _level_rows(self, level: Optional[str]) -> np.ndarray:
+        """Row positions of a level's words, or of every word when level is None"""
+        if not level:
+            return self._all_index
+        return self._level_index.get(level.lower(), _NO_ROWS)
+    
+    def _accuracy_pct(self, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Accuracy percentage of the given rows (default all), 0 for words without attempts"""
+        attempts = self._attempts if rows is None else self._attempts[rows]
+        correct = self._correct if rows is None else self._correct[rows]
+        return np.where(attempts > 0, correct / np.maximum(attempts, 1) * 100, 0.0)
+    
     def get_difficult_words(self, level: Optional[str] = None, limit: int = 10) -> List[Dict]:
         """
         Get words that need more practice (high weight)
@@ -262,36 +461,27 @@ class WordPicker:
         Returns:
             List of dictionaries with word info and stats
         """
-        difficult_words = []
+        # Filter by level first, then only include words with attempts and high weight
+        rows = self._level_rows(level)
+        idx = rows[(self._attempts[rows] >= 2) & (self._weights_vec[rows] >= 1.5)]
         
-        for word_key, stats in self.word_weights.items():
-            parts = word_key.split('_')
-            if len(parts) >= 3:
-                word = parts[0]
-                word_class = parts[1]
-                word_level = parts[2]
-                
-                # Filter by level if specified
-                if level and word_level != level.lower():
-                    continue
-                
-                # Only include words with attempts and high weight
-                if stats['total_attempts'] >= 2 and stats['weight'] >= 1.5:
-                    accuracy = (stats['correct_count'] / stats['total_attempts'] * 100) if stats['total_attempts'] > 0 else 0
-                    
-                    difficult_words.append({
-                        'word': word,
-                        'class': word_class,
-                        'level': word_level,
-                        'weight': stats['weight'],
-                        'accuracy': accuracy,
-                        'attempts': stats['total_attempts'],
-                        'consecutive_wrong': stats['consecutive_wrong']
-                    })
-        
-        # Sort by weight (descending) and return top results
-        difficult_words.sort(key=lambda x: x['weight'], reverse=True)
-        return difficult_words[:limit]
+        # Take the highest weights (descending) without sorting every candidate
+        weights = self._weights_vec[idx].tolist()
+        idx = idx[heapq.nlargest(limit, range(len(idx)), key=weights.__getitem__)]
+        accuracy = self._accuracy_pct(idx)
+        
+        difficult_words = []
+        for n, i in enumerate(idx.tolist()):
+            difficult_words.append({
+                'word': self._words_arr[i],
+                'class': self._classes_arr[i],
+                'level': self._levels_arr[i],
+                'weight': float(self._weights_vec[i]),
+                'accuracy': float(accuracy[n]),
+                'attempts': int(self._attempts[i]),
+                'consecutive_wrong': int(self._consec_wrong[i])
+            })
+        return difficult_words
     
     def get_mastered_words(self, level: Optional[str] = None, limit: int = 10) -> List[Dict]:
         """
@@ -304,92 +494,82 @@ class WordPicker:
         Returns:
             List of dictionaries with word info and stats
         """
-        mastered_words = []
+        # Filter by level first, then only include words with sufficient attempts and high accuracy
+        rows = self._level_rows(level)
+        accuracy = self._accuracy_pct(rows)
+        mask = (self._attempts[rows] >= 3) & (accuracy >= 80)
+        idx, accuracy = rows[mask], accuracy[mask]
         
-        for word_key, stats in self.word_weights.items():
-            parts = word_key.split('_')
-            if len(parts) >= 3:
-                word = parts[0]
-                word_class = parts[1]
-                word_level = parts[2]
-                
-                # Filter by level if specified
-                if level and word_level != level.lower():
-                    continue
-                
-                # Only include words with sufficient attempts and high accuracy
-                if (stats['total_attempts'] >= 3 and 
-                    stats['correct_count'] / stats['total_attempts'] >= 0.8):
-                    
-                    accuracy = stats['correct_count'] / stats['total_attempts'] * 100
-                    
-                    mastered_words.append({
-                        'word': word,
-                        'class': word_class,
-                        'level': word_level,
-                        'weight': stats['weight'],
-                        'accuracy': accuracy,
-                        'attempts': stats['total_attempts'],
-                        'consecutive_correct': stats['consecutive_correct']
-                    })
-        
-        # Sort by accuracy (descending) then by consecutive correct
-        mastered_words.sort(key=lambda x: (x['accuracy'], x['consecutive_correct']), reverse=True)
-        return mastered_words[:limit]
+        # Take the best by accuracy (descending) then by consecutive correct
+        sort_keys = list(zip(accuracy.tolist(), self._consec_correct[idx].tolist()))
+        top = heapq.nlargest(limit, range(len(idx)), key=sort_keys.__getitem__)
+        
+        mastered_words = []
+        for n in top:
+            i = idx[n]
+            mastered_words.append({
+                'word': self._words_arr[i],
+                'class': self._classes_arr[i],
+                'level': self._levels_arr[i],
+                'weight': float(self._weights_vec[i]),
+                'accuracy': float(accuracy[n]),
+                'attempts': int(self._attempts[i]),
+                'consecutive_correct': int(self._consec_correct[i])
+            })
+        return mastered_words
     
     def reset_word_stats(self, word: str, word_class: str, level: str):
         """Reset statistics for a specific word"""
         word_key = f"{word}_{word_class}_{level}"
-        if word_key in self.word_weights:
-            self.word_weights[word_key] = {
-                'weight': 1.0,
-                'correct_count': 0,
-                'wrong_count': 0,
-                'total_attempts': 0,
-                'last_seen': None,
-                'consecutive_correct': 0,
-                'consecutive_wrong': 0
-            }
-            self._save_weights()
+        if word_key in self._key_to_idx or word_key in self._extra_stats:
+            self._set_stats(word_key, _DEFAULT_STATS.copy())
+            self._mark_updated()
             print_info(f"Reset statistics for '{word}'")
     
     def reset_all_stats(self):
         """Reset all word statistics"""
-        for word_key in self.word_weights:
-            self.word_weights[word_key] = {
-                'weight': 1.0,
-                'correct_count': 0,
-                'wrong_count': 0,
-                'total_attempts': 0,
-                'last_seen': None,
-                'consecutive_correct': 0,
-                'consecutive_wrong': 0
-            }
+        for column, default in zip(self._stat_columns(), _DEFAULT_STATS.values()):
+            column.fill(default)
+        self._cum_weights.clear()
+        for word_key in self._extra_stats:
+            self._extra_stats[word_key] = _DEFAULT_STATS.copy()
         self._save_weights()
         print_info("Reset all word statistics")
     
     def export_statistics(self) -> Dict:
         """Export all statistics for analysis"""
-        export_data = {
-            'total_words': len(self.word_weights),
-            'words': {}
-        }
+        columns = [column.tolist() for column in self._stat_columns()]
+        words = {}
+        
+        for word_key, word, word_class, level, accuracy, values in zip(
+            self._key_list, self._words_arr, self._classes_arr, self._levels_arr,
+            self._accuracy_pct().tolist(), zip(*columns)
+        ):
+            stats = dict(zip(_DEFAULT_STATS, values))
+            words[word_key] = {
+                'word': word,
+                'class': word_class,
+                'level': level,
+                'accuracy': accuracy,
+                **stats
+            }
         
-        for word_key, stats in self.word_weights.items():
+        # Saved words no longer in the vocabulary are still part of the user's progress
+        for word_key, stats in self._extra_stats.items():
             parts = word_key.split('_')
             if len(parts) >= 3:
-                word = parts[0]
-                word_class = parts[1]
-                level = parts[2]
-                
-                accuracy = (stats['correct_count'] / stats['total_attempts'] * 100) if stats['total_attempts'] > 0 else 0
+                attempts = stats.get('total_attempts', 0)
+                accuracy = (stats.get('correct_count', 0) / attempts * 100) if attempts > 0 else 0.0
                 
-                export_data['words'][word_key] = {
-                    'word': word,
-                    'class': word_class,
-                    'level': level,
+                words[word_key] = {
+                    'word': parts[0],
+                    'class': parts[1],
+                    'level': parts[2],
                     'accuracy': accuracy,
                     **stats
                 }
         
-        return export_data
+        return {
+            'total_words': len(self._key_list) + len(self._extra_stats),
+            'words': words
+        }